@@ -0,0 +1,40 @@
+"""Shared fixtures for model tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from app.model.resource.common import _get_default_client
+
+# Client construction loads service models (~10ms each), so clients are built once.
+# They are created under mock_aws to pick up moto's fake credentials; moto intercepts
+# requests from any client while a mock is active, so tests keep their own @mock_aws
+# and still start from a fresh, empty backend. No per-mock invalidation is needed.
+# Under pytest-xdist each worker process builds its own clients and moto backends,
+# so the session scope needs no per-worker discriminator.
+_REGIONS = ("us-west-2", "us-east-1", "ap-southeast-2", "eu-west-1")
+
+
+@pytest.fixture(scope="session")
+def s3_clients() -> dict[str, Any]:
+    """S3 clients keyed by region, shared across the session."""
+    with mock_aws():
+        return {region: boto3.client("s3", region_name=region) for region in _REGIONS}
+
+
+@pytest.fixture(scope="session")
+def bucket_configurations() -> dict[str, dict[str, str]]:
+    """CreateBucketConfiguration keyed by region; us-east-1 takes none."""
+    return {region: {"LocationConstraint": region} for region in _REGIONS if region != "us-east-1"}
+
+
+@pytest.fixture(autouse=True)
+def _reset_default_clients():
+    """Drop cached default S3 clients so none built under one mock outlives it."""
+    _get_default_client.cache_clear()
+    yield
+    _get_default_client.cache_clear()
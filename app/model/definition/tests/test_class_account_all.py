@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import boto3
+import pytest
 from moto import mock_aws
 
 from app.model.definition.account import AccountDefinition
@@ -13,10 +13,10 @@ class TestAccountDefinition:
     """Test AccountDefinition configuration class."""
 
     @mock_aws
-    def test_init_with_all_parameters(self):
+    def test_init_with_all_parameters(self, s3_clients, bucket_configurations):
         """Test initialization with all parameters."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account_def = AccountDefinition(
             uri="s3://config-bucket/definitions/",
@@ -32,9 +32,9 @@ class TestAccountDefinition:
         assert account_def.prefix == "definitions/"
 
     @mock_aws
-    def test_init_with_minimal_parameters(self):
+    def test_init_with_minimal_parameters(self, s3_clients):
         """Test initialization with minimal parameters."""
-        client = boto3.client("s3", region_name="us-east-1")
+        client = s3_clients["us-east-1"]
         client.create_bucket(Bucket="minimal-bucket")
 
         account_def = AccountDefinition(
@@ -48,10 +48,10 @@ class TestAccountDefinition:
         assert account_def.region == "us-east-1"
 
     @mock_aws
-    def test_resolve_bucketname_from_uri(self):
+    def test_resolve_bucketname_from_uri(self, s3_clients, bucket_configurations):
         """Test _resolve_bucketname extracts bucket name from URI."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="my-config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="my-config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account_def = AccountDefinition(
             uri="s3://my-config-bucket/path/to/configs/",
@@ -62,10 +62,10 @@ class TestAccountDefinition:
         assert account_def.bucketname == "my-config-bucket"
 
     @mock_aws
-    def test_resolve_prefix_from_uri(self):
+    def test_resolve_prefix_from_uri(self, s3_clients, bucket_configurations):
         """Test _resolve_prefix extracts prefix from URI."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account_def = AccountDefinition(
             uri="s3://config-bucket/path/to/configs/",
@@ -76,10 +76,10 @@ class TestAccountDefinition:
         assert account_def.prefix == "path/to/configs/"
 
     @mock_aws
-    def test_resolve_prefix_with_root_path(self):
+    def test_resolve_prefix_with_root_path(self, s3_clients, bucket_configurations):
         """Test _resolve_prefix with root path."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account_def = AccountDefinition(
             uri="s3://config-bucket/",
@@ -90,10 +90,10 @@ class TestAccountDefinition:
         assert account_def.prefix == ""
 
     @mock_aws
-    def test_require_with_existing_key(self):
+    def test_require_with_existing_key(self, s3_clients, bucket_configurations):
         """Test require method with existing key."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account_def = AccountDefinition(
             uri="s3://config-bucket/",
@@ -108,10 +108,10 @@ class TestAccountDefinition:
         account_def.require(data, "rules")
 
     @mock_aws
-    def test_require_with_missing_key_strict_true(self):
+    def test_require_with_missing_key_strict_true(self, s3_clients, bucket_configurations):
         """Test require method with missing key in strict mode."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account_def = AccountDefinition(
             uri="s3://config-bucket/",
@@ -121,17 +121,14 @@ class TestAccountDefinition:
         )
 
         data = {"rules": []}
-        try:
+        with pytest.raises(KeyError, match="Missing required key 'bucket'"):
             account_def.require(data, "bucket", strict=True)
-            assert False, "Expected KeyError"
-        except KeyError as e:
-            assert "Missing required key 'bucket'" in str(e)
 
     @mock_aws
-    def test_require_with_missing_key_strict_false(self):
+    def test_require_with_missing_key_strict_false(self, s3_clients, bucket_configurations):
         """Test require method with missing key in non-strict mode."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account_def = AccountDefinition(
             uri="s3://config-bucket/",
@@ -145,10 +142,10 @@ class TestAccountDefinition:
         account_def.require(data, "bucket", strict=False)
 
     @mock_aws
-    def test_load_with_no_toml_files(self):
+    def test_load_with_no_toml_files(self, s3_clients, bucket_configurations):
         """Test load method with no TOML files in S3."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="empty-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="empty-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account_def = AccountDefinition(
             uri="s3://empty-bucket/definitions/",
@@ -161,10 +158,10 @@ class TestAccountDefinition:
         assert len(account_def.buckets) == 0
 
     @mock_aws
-    def test_load_with_single_toml_file(self):
+    def test_load_with_single_toml_file(self, s3_clients, bucket_configurations):
         """Test load method with single TOML file."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         # Upload a TOML file
         toml_content = """
@@ -193,10 +190,10 @@ Days = 30
         assert isinstance(account_def.buckets["test-bucket"], BucketDefinition)
 
     @mock_aws
-    def test_load_with_multiple_toml_files(self):
+    def test_load_with_multiple_toml_files(self, s3_clients, bucket_configurations):
         """Test load method with multiple TOML files."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         # Upload multiple TOML files
         toml1 = """
@@ -233,10 +230,10 @@ expiration = { days = 60 }
         assert "bucket-2" in account_def.buckets
 
     @mock_aws
-    def test_load_merges_rules_for_same_bucket(self):
+    def test_load_merges_rules_for_same_bucket(self, s3_clients, bucket_configurations):
         """Test that load merges rules from multiple files for the same bucket."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         # Upload multiple TOML files
         toml1 = """
@@ -281,10 +278,10 @@ expiration = { days = 60 }
         assert "rule-2" in rule_ids
 
     @mock_aws
-    def test_load_skips_non_toml_files(self):
+    def test_load_skips_non_toml_files(self, s3_clients, bucket_configurations):
         """Test that load skips non-TOML files."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         # Upload multiple TOML files
         toml1 = """
@@ -310,10 +307,10 @@ expiration = { days = 30 }
         assert len(account_def.buckets) == 1
 
     @mock_aws
-    def test_load_handles_malformed_toml(self):
+    def test_load_handles_malformed_toml(self, s3_clients, bucket_configurations):
         """Test that load handles malformed TOML files gracefully."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         # Upload malformed TOML
         malformed_toml = "this is [ not valid toml"
@@ -331,10 +328,10 @@ expiration = { days = 30 }
         assert len(account_def.buckets) == 0
 
     @mock_aws
-    def test_load_handles_missing_required_keys(self):
+    def test_load_handles_missing_required_keys(self, s3_clients, bucket_configurations):
         """Test that load handles TOML files missing required keys."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         # Upload TOML missing 'rules' key
         incomplete_toml = """
@@ -357,11 +354,11 @@ name = "incomplete-bucket"
         assert len(account_def.buckets) == 1
 
     @mock_aws
-    def test_describe_returns_correct_info(self):
+    def test_describe_returns_correct_info(self, s3_clients, bucket_configurations):
         """Test describe method returns correct information."""
-        client = boto3.client("s3", region_name="ap-southeast-2")
+        client = s3_clients["ap-southeast-2"]
         client.create_bucket(
-            Bucket="describe-bucket", CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"}
+            Bucket="describe-bucket", CreateBucketConfiguration=bucket_configurations["ap-southeast-2"]
         )
 
         account_def = AccountDefinition(
@@ -380,9 +377,9 @@ name = "incomplete-bucket"
         assert result["prefix"] == "configs/"
 
     @mock_aws
-    def test_to_dict_returns_complete_structure(self):
+    def test_to_dict_returns_complete_structure(self, s3_clients):
         """Test to_dict method returns complete structure."""
-        client = boto3.client("s3", region_name="us-east-1")
+        client = s3_clients["us-east-1"]
         client.create_bucket(Bucket="dict-bucket")
 
         account_def = AccountDefinition(
@@ -402,10 +399,10 @@ name = "incomplete-bucket"
         assert isinstance(result["buckets"], dict)
 
     @mock_aws
-    def test_account_definition_inheritance_from_s3component(self):
+    def test_account_definition_inheritance_from_s3component(self, s3_clients, bucket_configurations):
         """Test that AccountDefinition inherits from S3Component."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account_def = AccountDefinition(
             uri="s3://test-bucket/",
@@ -418,10 +415,10 @@ name = "incomplete-bucket"
         assert hasattr(account_def, "resolve_date")
 
     @mock_aws
-    def test_buckets_have_parent_reference(self):
+    def test_buckets_have_parent_reference(self, s3_clients, bucket_configurations):
         """Test that loaded bucket definitions have parent reference."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="config-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         toml_content = """
 [bucket]
@@ -450,13 +447,13 @@ Days = 30
         assert bucket_def.region == "us-west-2"
 
     @mock_aws
-    def test_multiple_accounts_different_uris(self):
+    def test_multiple_accounts_different_uris(self, s3_clients, bucket_configurations):
         """Test creating multiple AccountDefinition objects with different URIs."""
-        client1 = boto3.client("s3", region_name="us-east-1")
-        client2 = boto3.client("s3", region_name="eu-west-1")
+        client1 = s3_clients["us-east-1"]
+        client2 = s3_clients["eu-west-1"]
 
         client1.create_bucket(Bucket="account1-config")
-        client2.create_bucket(Bucket="account2-config", CreateBucketConfiguration={"LocationConstraint": "eu-west-1"})
+        client2.create_bucket(Bucket="account2-config", CreateBucketConfiguration=bucket_configurations["eu-west-1"])
 
         account_def1 = AccountDefinition(
             uri="s3://account1-config/",
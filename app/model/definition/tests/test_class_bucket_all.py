@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import boto3
+from unittest.mock import MagicMock
+
+import pytest
 from moto import mock_aws
 
 from app.model.definition.bucket import BucketDefinition
@@ -14,9 +16,9 @@ class TestBucketDefinition:
     """Test BucketDefinition configuration class."""
 
     @mock_aws
-    def test_init_with_all_parameters(self):
+    def test_init_with_all_parameters(self, s3_clients):
         """Test initialization with all parameters."""
-        client = boto3.client("s3", region_name="us-west-2")
+        client = s3_clients["us-west-2"]
         config = LifecycleConfiguration(
             rules=[LifecycleRule(id="test-rule", status="Enabled", expiration={"days": 30})]
         )
@@ -137,11 +139,8 @@ class TestBucketDefinition:
             account="123456789012",
             region="us-west-2",
         )
-        try:
+        with pytest.raises(ValueError, match="Invalid lifecycle_configuration type"):
             bucket_def._resolve_lifecycle_configuration("invalid")
-            assert False, "Expected ValueError"
-        except ValueError as e:
-            assert "Invalid lifecycle_configuration type" in str(e)
 
     @mock_aws
     def test_describe_without_lifecycle_configuration(self):
@@ -174,24 +173,24 @@ class TestBucketDefinition:
         assert "lifecycle_configuration" in result
         assert isinstance(result["lifecycle_configuration"], dict)
 
-    @mock_aws
     def test_bucket_definition_inheritance_from_s3component(self):
         """Test that BucketDefinition inherits from S3Component."""
         bucket_def = BucketDefinition(
             name="test-bucket",
             account="123456789012",
             region="us-west-2",
+            client=MagicMock(),
         )
         assert hasattr(bucket_def, "describe")
         assert hasattr(bucket_def, "to_dict")
         assert hasattr(bucket_def, "resolve_date")
 
     @mock_aws
-    def test_bucket_definition_with_parent(self):
+    def test_bucket_definition_with_parent(self, s3_clients):
         """Test BucketDefinition with parent S3Component."""
         from app.model.definition.account import AccountDefinition
 
-        client = boto3.client("s3", region_name="us-east-1")
+        client = s3_clients["us-east-1"]
         # Create a mock S3 bucket for the definition storage
         client.create_bucket(Bucket="config-bucket")
 
@@ -214,10 +213,9 @@ class TestBucketDefinition:
         assert bucket_def.region == "us-east-1"
         assert bucket_def.parent == account_def
 
-    @mock_aws
     def test_multiple_bucket_definitions(self):
         """Test creating multiple BucketDefinition objects."""
-        client = boto3.client("s3", region_name="us-west-2")
+        client = MagicMock()
 
         bucket_def1 = BucketDefinition(
             name="bucket-1",
@@ -236,13 +234,13 @@ class TestBucketDefinition:
         assert bucket_def2.name == "bucket-2"
         assert bucket_def1.account != bucket_def2.account
 
-    @mock_aws
     def test_bucket_definition_name_with_special_characters(self):
         """Test BucketDefinition with various naming formats."""
         bucket_def = BucketDefinition(
             name="my-test-bucket-123",
             account="123456789012",
             region="us-east-1",
+            client=MagicMock(),
         )
         assert bucket_def.name == "my-test-bucket-123"
 
@@ -38,13 +38,16 @@ class AbortIncompleteMultipartUpload(S3Configuration):
     ```
     """
 
+    __slots__ = ("daysafterinitiation", "_frozen")
+
     @classmethod
     def from_dict(
         cls,
         data: dict[str, Any],
     ) -> AbortIncompleteMultipartUpload:
-        return cls(
-            daysafterinitiation=(data.get("DaysAfterInitiation") or data.get("daysafterinitiation")),
+        data = cls.casefold_keys(data)
+        return cls.pooled(
+            daysafterinitiation=data.get("daysafterinitiation"),
         )
 
     def __init__(
@@ -52,6 +55,7 @@ class AbortIncompleteMultipartUpload(S3Configuration):
         daysafterinitiation: int | str | None = None,
     ) -> None:
         self.daysafterinitiation: int | None = self.resolve_days(daysafterinitiation)
+        self._frozen = True
 
     def describe(self) -> dict[str, Any]:
         result = {}
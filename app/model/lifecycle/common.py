@@ -2,11 +2,28 @@ from __future__ import annotations
 
 import hashlib
 import json
+import threading
+import weakref
 from abc import ABC
 from datetime import date, datetime
+from typing import Any
 
 from app.model.lifecycle.storageclass import StorageClass
 
+# Flyweight pool: (class, frozen constructor kwargs) -> live shared instance
+_POOL: weakref.WeakValueDictionary[Any, S3Configuration] = weakref.WeakValueDictionary()
+# Buckets may load on a thread pool (Account.list_buckets), so pool lookups are serialized
+_POOL_LOCK = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    # Keep the type so that True/1/1.0 never share a cache slot
+    return (value.__class__, value)
+
 
 class S3Configuration(ABC):
     """
@@ -14,14 +31,20 @@ class S3Configuration(ABC):
     - Abstract base class for AWS S3 lifecycle configuration components
     - Provides common utility methods for resolving dates, days, and storage classes
     - Defines interface for describe(), to_payload(), and to_dict() methods
+    - Subclasses that set _frozen at the end of __init__ reject later attribute assignment
+    - Instances built via from_dict() are pooled and shared; only frozen classes may be pooled
 
     Methods:
     - resolve_days(value): Convert value to integer days
+    - resolve_days_pair(first, second): Convert two day values in one call
     - resolve_date(value): Convert value to date object
     - resolve_storageclass(value): Convert value to StorageClass enum
+    - casefold_keys(data): Normalize dict keys for single-lookup from_dict parsing
+    - pooled(**kwargs): Return a shared instance for identical constructor arguments
     - describe(): Return human-readable dict representation
     - get_fingerprint(): Generate SHA256 hash of configuration
     - to_payload(): Convert to AWS API payload format
+    - to_payload_json(): Serialize to_payload() to compact JSON bytes (orjson when installed)
     - to_dict(): Convert to serializable dict format
 
     Attrs:
@@ -38,6 +61,23 @@ class S3Configuration(ABC):
     ```
     """
 
+    # Subclasses declare their own __slots__; __weakref__ keeps them poolable
+    __slots__ = ("__weakref__",)
+
+    # Subclasses set self._frozen = True at the end of __init__ to become immutable
+    _frozen = False
+
+    def __setattr__(
+        self,
+        name: str,
+        value: Any,
+    ) -> None:
+        # An unset _frozen slot reads as not frozen
+        if getattr(self, "_frozen", False):
+            msg = f"{self.__class__.__name__} is immutable, cannot set {name!r}."
+            raise AttributeError(msg)
+        super().__setattr__(name, value)
+
     def resolve_days(
         self,
         value: int | None,
@@ -52,6 +92,16 @@ class S3Configuration(ABC):
             msg = f"Invalid days value: {value!r}."
             raise ValueError(msg)
 
+    def resolve_days_pair(
+        self,
+        first: int | str | None,
+        second: int | str | None,
+    ) -> tuple[int | None, int | None]:
+        # Fast path: both values already int or None
+        if (first is None or first.__class__ is int) and (second is None or second.__class__ is int):
+            return first, second
+        return self.resolve_days(first), self.resolve_days(second)
+
     def resolve_date(
         self,
         value: date | str | None,
@@ -61,7 +111,9 @@ class S3Configuration(ABC):
         if isinstance(value, date):
             return value
         if isinstance(value, str):
-            resolved = datetime.strptime(value, "%Y-%m-%d").date()  # YYYY-MM-DD
+            if len(value) == 10 and value[4] == "-" and value[7] == "-":
+                return date.fromisoformat(value)  # YYYY-MM-DD, parsed in C
+            resolved = datetime.strptime(value, "%Y-%m-%d").date()
             return resolved
         else:
             msg = f"Invalid date value: {value!r}."
@@ -73,8 +125,37 @@ class S3Configuration(ABC):
     ) -> StorageClass | None:
         if storageclass is None:
             return None
+        if storageclass.__class__ is StorageClass:
+            return storageclass
         return StorageClass.from_any(storageclass)
 
+    @staticmethod
+    def casefold_keys(
+        data: dict[str, Any],
+    ) -> dict[str, Any]:
+        # "NoncurrentDays", "noncurrentdays" and "noncurrent_days" all map to "noncurrentdays"
+        return {key.lower().replace("_", ""): value for key, value in data.items()}
+
+    @classmethod
+    def pooled(
+        cls,
+        **kwargs: Any,
+    ) -> S3Configuration:
+        # Identical children (e.g. Expiration(days=30)) are shared across rules while alive
+        key = (cls, _freeze(kwargs))
+        with _POOL_LOCK:
+            obj = _POOL.get(key)
+        if obj is not None:
+            return obj
+        # Built outside the lock so constructors never serialize on it or deadlock by pooling in turn
+        obj = cls(**kwargs)
+        if not obj._frozen:
+            msg = f"{cls.__name__} is mutable and cannot be pooled."
+            raise TypeError(msg)
+        with _POOL_LOCK:
+            # Another thread may have pooled an equal instance meanwhile; keep the first one
+            return _POOL.setdefault(key, obj)
+
     def describe(self) -> dict[str, str]:
         result = {}
         return result
@@ -88,6 +169,16 @@ class S3Configuration(ABC):
     def to_payload(self) -> dict[str, str]:
         raise NotImplementedError()
 
+    def to_payload_json(self) -> bytes:
+        # orjson is an optional extra (app-lakecircle[json]), imported here so the model does not require it
+        try:
+            import orjson
+        except ImportError:
+            # Same bytes as orjson: compact separators, raw UTF-8, dates as YYYY-MM-DD
+            payload = self.to_payload()
+            return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=date.isoformat).encode()
+        return orjson.dumps(self.to_payload())
+
     def to_dict(self) -> dict[str, str]:
         result = {}
         return result
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Any, Union
+from typing import Any
 
 from app.model.lifecycle.common import S3Configuration
 
@@ -40,17 +40,18 @@ class Expiration(S3Configuration):
     ```
     """
 
+    __slots__ = ("date", "days", "expired_object_delete_marker", "_date_str", "_frozen")
+
     @classmethod
     def from_dict(
         cls,
         data: dict[str, Any],
     ) -> Expiration:
-        return cls(
-            date=data.get("Date") or data.get("date"),
-            days=data.get("Days") or data.get("days"),
-            expired_object_delete_marker=(
-                data.get("ExpiredObjectDeleteMarker") or data.get("expiredobjectdeletemarker")
-            ),
+        data = cls.casefold_keys(data)
+        return cls.pooled(
+            date=data.get("date"),
+            days=data.get("days"),
+            expired_object_delete_marker=data.get("expiredobjectdeletemarker"),
         )
 
     def __init__(
@@ -60,13 +61,16 @@ class Expiration(S3Configuration):
         expired_object_delete_marker: bool | None = None,
     ) -> None:
         self.date = self.resolve_date(date)
+        # Formatted once; describe() and to_dict() reuse it
+        self._date_str: str | None = self.date.strftime("%Y-%m-%d") if self.date else None
         self.days = self.resolve_days(days)
         self.expired_object_delete_marker = expired_object_delete_marker
+        self._frozen = True
 
-    def describe(self) -> dict[str, Union[str, int, bool]]:
+    def describe(self) -> dict[str, str | int | bool]:
         result = {}
-        if self.date:
-            result["date"] = self.date.strftime("%Y-%m-%d")
+        if self._date_str:
+            result["date"] = self._date_str
         if self.days is not None:
             result["days"] = self.days
         if self.expired_object_delete_marker is not None:
@@ -85,7 +89,7 @@ class Expiration(S3Configuration):
 
     def to_dict(self) -> dict[str, Any]:
         result = {
-            "date": self.date.strftime("%Y-%m-%d") if self.date else None,
+            "date": self._date_str,
             "days": self.days,
             "expired_object_delete_marker": self.expired_object_delete_marker,
         }
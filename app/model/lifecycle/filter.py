@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Union
+from typing import Any
 
 from app.model.lifecycle.common import S3Configuration
 
@@ -47,17 +47,21 @@ class Filter(S3Configuration):
     ```
     """
 
+    __slots__ = ("prefix", "tag_key", "tag_value", "object_size_greater_than", "object_size_less_than", "_frozen")
+
     @classmethod
     def from_dict(
         cls,
         data: dict[str, Any],
     ) -> Filter:
-        prefix = data.get("Prefix") or data.get("prefix")
-        tag_key = data.get("Tag", {}).get("Key") or data.get("tag", {}).get("key")
-        tag_value = data.get("Tag", {}).get("Value") or data.get("tag", {}).get("value")
-        object_size_less_than = data.get("ObjectSizeLessThan") or data.get("object_size_less_than")
-        object_size_greater_than = data.get("ObjectSizeGreaterThan") or data.get("object_size_greater_than")
-        return cls(
+        data = cls.casefold_keys(data)
+        tag = cls.casefold_keys(data.get("tag") or {})
+        prefix = data.get("prefix")
+        tag_key = tag.get("key")
+        tag_value = tag.get("value")
+        object_size_less_than = data.get("objectsizelessthan")
+        object_size_greater_than = data.get("objectsizegreaterthan")
+        return cls.pooled(
             prefix=prefix,
             tag_key=tag_key,
             tag_value=tag_value,
@@ -78,8 +82,9 @@ class Filter(S3Configuration):
         self.tag_value = tag_value
         self.object_size_greater_than = object_size_greater_than
         self.object_size_less_than = object_size_less_than
+        self._frozen = True
 
-    def describe(self) -> dict[str, Union[str, int, bool]]:
+    def describe(self) -> dict[str, str | int | bool]:
         result = {}
         if self.prefix:
             result["prefix"] = self.prefix
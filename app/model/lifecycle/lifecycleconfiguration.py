@@ -53,20 +53,16 @@ class LifecycleConfiguration(S3Configuration):
         cls,
         data: dict[str, Any],
     ) -> LifecycleConfiguration:
+        data = cls.casefold_keys(data)
         # Try to get Rules from nested LifecycleConfiguration first, then top level
-        rules = (
-            data.get("LifecycleConfiguration", {}).get("Rules")
-            or data.get("lifecycleconfiguration", {}).get("rules")
-            or data.get("Rules")
-            or data.get("rules")
-        )
+        nested = cls.casefold_keys(data.get("lifecycleconfiguration") or {})
+        rules = nested.get("rules") or data.get("rules")
         return cls(
-            bucket=data.get("Bucket") or data.get("bucket"),
-            checksumalgorithm=data.get("ChecksumAlgorithm") or data.get("checksumalgorithm"),
+            bucket=data.get("bucket"),
+            checksumalgorithm=data.get("checksumalgorithm"),
             rules=rules,
-            expectedbucketowner=data.get("ExpectedBucketOwner") or data.get("expectedbucketowner"),
-            transitiondefaultminimumobjectsize=data.get("TransitionDefaultMinimumObjectSize")
-            or data.get("transitiondefaultminimumobjectsize"),
+            expectedbucketowner=data.get("expectedbucketowner"),
+            transitiondefaultminimumobjectsize=data.get("transitiondefaultminimumobjectsize"),
         )
 
     def __init__(
@@ -91,6 +87,11 @@ class LifecycleConfiguration(S3Configuration):
         result: dict[str, LifecycleRule] = {}
         if rules is None:
             return result
+        # AWS responses and definitions are all dicts: parse them in one batch
+        if all(isinstance(item, dict) for item in rules):
+            for item in LifecycleRule.from_response(rules):
+                result[item.fingerprint] = item
+            return result
         for item in rules:
             if isinstance(item, LifecycleRule):
                 result[item.fingerprint] = item
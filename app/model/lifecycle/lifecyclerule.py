@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Literal, Union
+import sys
+from collections.abc import Iterable
+from typing import Any, Literal
 
 from app.model.lifecycle.abortincompletemultipartupload import AbortIncompleteMultipartUpload
 from app.model.lifecycle.common import S3Configuration
@@ -10,6 +12,52 @@ from app.model.lifecycle.noncurrentversionexpiration import NoncurrentVersionExp
 from app.model.lifecycle.noncurrentversiontransition import NoncurrentVersionTransition
 from app.model.lifecycle.transition import Transition
 
+# Interned status singletons; any casing of the two AWS values resolves to these
+_ENABLED = sys.intern("Enabled")
+_DISABLED = sys.intern("Disabled")
+_STATUSES = {"enabled": _ENABLED, "disabled": _DISABLED}
+
+
+def _coerce(
+    value: Any,
+    cls: type[S3Configuration],
+) -> Any:
+    # Resolve a rule child from an instance of cls or a dict; anything else is dropped
+    if value is None or value.__class__ is cls:
+        return value
+    if isinstance(value, dict):
+        return cls.from_dict(value)
+    if isinstance(value, cls):
+        return value
+    return None
+
+
+def _coerce_list(
+    items: Iterable[Any] | None,
+    cls: type[S3Configuration],
+) -> list[Any]:
+    if items is None:
+        return []
+    # Generators and dict views are accepted as any iterable was before; index needs a list
+    if items.__class__ is not list:
+        items = list(items)
+    if not items:
+        return []
+    # Inputs are usually homogeneous (all objects or all dicts): one class-identity pass confirms
+    # that, then items convert without _coerce's per-item isinstance fallbacks
+    kind = items[0].__class__
+    if (kind is cls or kind is dict) and all(item.__class__ is kind for item in items):
+        if kind is cls:
+            return list(items)
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+    result = []
+    for item in items:
+        obj = _coerce(item, cls)
+        if obj is not None:
+            result.append(obj)
+    return result
+
 
 class LifecycleRule(S3Configuration):
     """
@@ -17,10 +65,12 @@ class LifecycleRule(S3Configuration):
     - Represents a single S3 lifecycle rule with all possible actions
     - Supports expiration, transitions, filters, and multipart upload abort
     - Automatically generates fingerprint for deduplication
+    - Immutable after construction, as are its child components, so the fingerprint never goes stale
     - Maps to AWS S3 lifecycle rule structure
 
     Methods:
     - from_dict(data): Create from AWS API response or dict
+    - from_response(rules): Create a list of rules from an AWS "Rules" list in one pass
     - describe(): Return human-readable dict representation
     - to_payload(): Convert to AWS API request format
     - to_dict(): Serialize to dict format
@@ -35,7 +85,7 @@ class LifecycleRule(S3Configuration):
     - noncurrent_transitions: List of transitions for noncurrent versions
     - noncurrent_expiration: Expiration settings for noncurrent versions
     - abort_incomplete_multipart_upload: Multipart upload cleanup settings
-    - fingerprint: SHA256 hash for rule identification
+    - fingerprint: SHA256 hash for rule identification (computed on first access)
 
     Example:
     ```python
@@ -59,23 +109,71 @@ class LifecycleRule(S3Configuration):
     ```
     """
 
+    # (attribute, output key) in emission order; falsy attributes are skipped
+    _DESCRIBE_FIELDS: tuple[tuple[str, str], ...] = (
+        ("prefix", "prefix"),
+        ("filter", "filter"),
+        ("status", "status"),
+        ("expiration", "expiration"),
+        ("transitions", "transitions"),
+        ("noncurrent_transitions", "noncurrent_transitions"),
+        ("noncurrent_expiration", "noncurrent_expiration"),
+        ("abort_incomplete_multipart_upload", "abort_incomplete_multipart_upload"),
+    )
+    _PAYLOAD_FIELDS: tuple[tuple[str, str], ...] = (
+        ("id", "ID"),
+        ("filter", "Filter"),
+        ("prefix", "Prefix"),
+        ("status", "Status"),
+        ("expiration", "Expiration"),
+        ("transitions", "Transitions"),
+        ("noncurrent_transitions", "NoncurrentVersionTransitions"),
+        ("noncurrent_expiration", "NoncurrentVersionExpiration"),
+        ("abort_incomplete_multipart_upload", "AbortIncompleteMultipartUpload"),
+    )
+    _DICT_FIELDS: tuple[tuple[str, str], ...] = (("id", "id"),) + _DESCRIBE_FIELDS
+
     @classmethod
     def from_dict(
         cls,
         data: dict[str, Any],
+    ) -> LifecycleRule:
+        return cls._from_casefolded(cls.casefold_keys(data))
+
+    @classmethod
+    def from_response(
+        cls,
+        rules: list[dict[str, Any]],
+    ) -> list[LifecycleRule]:
+        casefold = cls.casefold_keys
+        build = cls._from_casefolded
+        return [build(casefold(data)) for data in rules]
+
+    @classmethod
+    def _from_casefolded(
+        cls,
+        data: dict[str, Any],
     ) -> LifecycleRule:
         return cls(
-            id=data.get("ID") or data.get("id"),
-            prefix=data.get("Prefix") or data.get("prefix"),
-            status=data.get("Status") or data.get("status"),
-            filter=data.get("Filter") or data.get("filter"),
-            expiration=(data.get("Expiration") or data.get("expiration")),
-            transitions=(data.get("Transitions") or data.get("transitions")),
-            noncurrent_transitions=(data.get("NoncurrentVersionTransitions") or data.get("noncurrent_transitions")),
-            noncurrent_expiration=(data.get("NoncurrentVersionExpiration") or data.get("noncurrent_expiration")),
-            abort_incomplete_multipart_upload=(
-                data.get("AbortIncompleteMultipartUpload") or data.get("abort_incomplete_multipart_upload")
+            id=data.get("id"),
+            prefix=data.get("prefix"),
+            status=data.get("status"),
+            filter=data.get("filter"),
+            expiration=data.get("expiration"),
+            transitions=data.get("transitions"),
+            # AWS names differ from the snake_case attributes for the noncurrent actions
+            # (membership test, so an explicit empty AWS value is not overridden by the alias)
+            noncurrent_transitions=(
+                data["noncurrentversiontransitions"]
+                if "noncurrentversiontransitions" in data
+                else data.get("noncurrenttransitions")
             ),
+            noncurrent_expiration=(
+                data["noncurrentversionexpiration"]
+                if "noncurrentversionexpiration" in data
+                else data.get("noncurrentexpiration")
+            ),
+            abort_incomplete_multipart_upload=data.get("abortincompletemultipartupload"),
         )
 
     def __init__(
@@ -91,99 +189,40 @@ class LifecycleRule(S3Configuration):
         abort_incomplete_multipart_upload: AbortIncompleteMultipartUpload | dict | None = None,
     ) -> None:
         self.prefix = prefix
-        self.filter = self._resolve_filter(filter)
-        self.status = status
-        self.expiration = self._resolve_expiration(expiration)
-        self.transitions = self._resolve_transitions(transitions)
-        self.noncurrent_transitions = self._resolve_noncurrent_transitions(noncurrent_transitions)
-        self.noncurrent_expiration = self._resolve_noncurrent_expiration(noncurrent_expiration)
-        self.abort_incomplete_multipart_upload = self._resolve_abort_incomplete_multipart_upload(
-            abort_incomplete_multipart_upload
+        self.filter: Filter | None = _coerce(filter, Filter)
+        self.status = self._resolve_status(status)
+        self.expiration: Expiration | None = _coerce(expiration, Expiration)
+        self.transitions: list[Transition] = _coerce_list(transitions, Transition)
+        self.noncurrent_transitions: list[NoncurrentVersionTransition] = _coerce_list(
+            noncurrent_transitions,
+            NoncurrentVersionTransition,
+        )
+        self.noncurrent_expiration: NoncurrentVersionExpiration | None = _coerce(
+            noncurrent_expiration,
+            NoncurrentVersionExpiration,
         )
-        self.fingerprint = self.get_fingerprint()
+        self.abort_incomplete_multipart_upload: AbortIncompleteMultipartUpload | None = _coerce(
+            abort_incomplete_multipart_upload,
+            AbortIncompleteMultipartUpload,
+        )
+        self._fingerprint: str | None = None
         self.id = id or self.fingerprint
+        self._frozen = True
 
-    def _resolve_transitions(
-        self,
-        transitions: list[Transition] | list[dict] | None,
-    ) -> list[Transition]:
-        result: list[Transition] = []
-        if transitions is None:
-            return result
-        for item in transitions:
-            if isinstance(item, Transition):
-                result.append(item)
-            elif isinstance(item, dict):
-                obj = Transition.from_dict(item)
-                result.append(obj)
-        return result
-
-    def _resolve_noncurrent_transitions(
-        self,
-        noncurrent_transitions: list[NoncurrentVersionTransition] | list[dict] | None,
-    ) -> list[NoncurrentVersionTransition]:
-        result: list[NoncurrentVersionTransition] = []
-        if noncurrent_transitions is None:
-            return result
-        for item in noncurrent_transitions:
-            if isinstance(item, NoncurrentVersionTransition):
-                result.append(item)
-            elif isinstance(item, dict):
-                obj = NoncurrentVersionTransition.from_dict(item)
-                result.append(obj)
-        return result
-
-    def _resolve_expiration(
-        self,
-        expiration: Expiration | dict | None,
-    ) -> Expiration | None:
-        if expiration is None:
-            return None
-        if isinstance(expiration, Expiration):
-            return expiration
-        elif isinstance(expiration, dict):
-            obj = Expiration.from_dict(expiration)
-            return obj
-        return None
-
-    def _resolve_filter(
-        self,
-        filter: Filter | dict | None,
-    ) -> Filter | None:
-        if filter is None:
-            return None
-        if isinstance(filter, Filter):
-            return filter
-        elif isinstance(filter, dict):
-            obj = Filter.from_dict(filter)
-            return obj
-        return None
-
-    def _resolve_noncurrent_expiration(
-        self,
-        noncurrent_expiration: NoncurrentVersionExpiration | dict | None,
-    ) -> NoncurrentVersionExpiration | None:
-        if noncurrent_expiration is None:
-            return None
-        if isinstance(noncurrent_expiration, NoncurrentVersionExpiration):
-            return noncurrent_expiration
-        elif isinstance(noncurrent_expiration, dict):
-            obj = NoncurrentVersionExpiration.from_dict(noncurrent_expiration)
-            return obj
-        return None
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            # Bypass the frozen guard: the fingerprint is derived, not user state
+            self.__dict__["_fingerprint"] = self.get_fingerprint()
+        return self._fingerprint
 
-    def _resolve_abort_incomplete_multipart_upload(
+    def _resolve_status(
         self,
-        abort_incomplete_multipart_upload: AbortIncompleteMultipartUpload | dict | None,
-    ) -> AbortIncompleteMultipartUpload | None:
-        if abort_incomplete_multipart_upload is None:
-            return None
-        if isinstance(abort_incomplete_multipart_upload, AbortIncompleteMultipartUpload):
-            return abort_incomplete_multipart_upload
-        elif isinstance(abort_incomplete_multipart_upload, dict):
-            obj = AbortIncompleteMultipartUpload.from_dict(abort_incomplete_multipart_upload)
-            return obj
-        return None
+        status: str | None,
+    ) -> str | None:
+        if status is _ENABLED or status is _DISABLED or not isinstance(status, str):
+            return status
+        return _STATUSES.get(status.lower(), status)
 
     def __str__(self):
         return self.id
@@ -191,69 +230,29 @@ class LifecycleRule(S3Configuration):
     def __repr__(self):
         return f"{self.__class__.__name__}({self.id!r})"
 
-    def describe(self) -> dict[str, Union[str, int, bool]]:
+    def _collect(
+        self,
+        fields: tuple[tuple[str, str], ...],
+        method: str,
+    ) -> dict[str, Any]:
         result = {}
-        # if self.id:
-        #     result["id"] = self.id
-        if self.prefix:
-            result["prefix"] = self.prefix
-        if self.filter:
-            result["filter"] = self.filter.describe()
-        if self.status:
-            result["status"] = self.status
-        if self.expiration:
-            result["expiration"] = self.expiration.describe()
-        if self.transitions:
-            result["transitions"] = [t.describe() for t in self.transitions]
-        if self.noncurrent_transitions:
-            result["noncurrent_transitions"] = [nct.describe() for nct in self.noncurrent_transitions]
-        if self.noncurrent_expiration:
-            result["noncurrent_expiration"] = self.noncurrent_expiration.describe()
-        if self.abort_incomplete_multipart_upload:
-            result["abort_incomplete_multipart_upload"] = self.abort_incomplete_multipart_upload.describe()
+        for attr, key in fields:
+            value = getattr(self, attr)
+            if not value:
+                continue
+            if isinstance(value, list):
+                value = [getattr(item, method)() for item in value]
+            elif isinstance(value, S3Configuration):
+                value = getattr(value, method)()
+            result[key] = value
         return result
 
+    def describe(self) -> dict[str, str | int | bool]:
+        return self._collect(self._DESCRIBE_FIELDS, "describe")
+
     def to_payload(self) -> dict[str, Any]:
-        result = {}
-        if self.id:
-            result["ID"] = self.id
-        # AWS requires either Prefix or Filter - default to empty Prefix if neither provided
-        if self.filter:
-            result["Filter"] = self.filter.to_payload()
-        if self.prefix:
-            result["Prefix"] = self.prefix
-        if self.status:
-            result["Status"] = self.status
-        if self.expiration:
-            result["Expiration"] = self.expiration.to_payload()
-        if self.transitions:
-            result["Transitions"] = [t.to_payload() for t in self.transitions]
-        if self.noncurrent_transitions:
-            result["NoncurrentVersionTransitions"] = [nct.to_payload() for nct in self.noncurrent_transitions]
-        if self.noncurrent_expiration:
-            result["NoncurrentVersionExpiration"] = self.noncurrent_expiration.to_payload()
-        if self.abort_incomplete_multipart_upload:
-            result["AbortIncompleteMultipartUpload"] = self.abort_incomplete_multipart_upload.to_payload()
-        return result
+        # AWS requires either Prefix or Filter - both are emitted only when set
+        return self._collect(self._PAYLOAD_FIELDS, "to_payload")
 
     def to_dict(self) -> dict[str, Any]:
-        result = {}
-        if self.id:
-            result["id"] = self.id
-        if self.prefix:
-            result["prefix"] = self.prefix
-        if self.filter:
-            result["filter"] = self.filter.to_dict()
-        if self.status:
-            result["status"] = self.status
-        if self.expiration:
-            result["expiration"] = self.expiration.to_dict()
-        if self.transitions:
-            result["transitions"] = [t.to_dict() for t in self.transitions]
-        if self.noncurrent_transitions:
-            result["noncurrent_transitions"] = [nct.to_dict() for nct in self.noncurrent_transitions]
-        if self.noncurrent_expiration:
-            result["noncurrent_expiration"] = self.noncurrent_expiration.to_dict()
-        if self.abort_incomplete_multipart_upload:
-            result["abort_incomplete_multipart_upload"] = self.abort_incomplete_multipart_upload.to_dict()
-        return result
+        return self._collect(self._DICT_FIELDS, "to_dict")
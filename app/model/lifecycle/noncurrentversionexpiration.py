@@ -38,14 +38,17 @@ class NoncurrentVersionExpiration(S3Configuration):
     ```
     """
 
+    __slots__ = ("noncurrentdays", "newernoncurrentversions", "_frozen")
+
     @classmethod
     def from_dict(
         cls,
         data: dict[str, Any],
     ) -> NoncurrentVersionExpiration:
-        return cls(
-            noncurrentdays=data.get("NoncurrentDays") or data.get("noncurrentdays"),
-            newernoncurrentversions=data.get("NewerNoncurrentVersions") or data.get("newernoncurrentversions"),
+        data = cls.casefold_keys(data)
+        return cls.pooled(
+            noncurrentdays=data.get("noncurrentdays"),
+            newernoncurrentversions=data.get("newernoncurrentversions"),
         )
 
     def __init__(
@@ -53,8 +56,13 @@ class NoncurrentVersionExpiration(S3Configuration):
         noncurrentdays: int | str | None = None,
         newernoncurrentversions: int | str | None = None,
     ) -> None:
-        self.noncurrentdays: int | None = self.resolve_days(noncurrentdays)
-        self.newernoncurrentversions: int | None = self.resolve_days(newernoncurrentversions)
+        self.noncurrentdays: int | None
+        self.newernoncurrentversions: int | None
+        self.noncurrentdays, self.newernoncurrentversions = self.resolve_days_pair(
+            noncurrentdays,
+            newernoncurrentversions,
+        )
+        self._frozen = True
 
     def describe(self) -> dict[str, Any]:
         result = {}
@@ -44,15 +44,18 @@ class NoncurrentVersionTransition(S3Configuration):
     ```
     """
 
+    __slots__ = ("noncurrentdays", "newernoncurrentversions", "storageclass", "_frozen")
+
     @classmethod
     def from_dict(
         cls,
         data: dict[str, Any],
     ) -> NoncurrentVersionTransition:
-        return cls(
-            noncurrentdays=data.get("NoncurrentDays") or data.get("noncurrentdays"),
-            newernoncurrentversions=data.get("NewerNoncurrentVersions") or data.get("newernoncurrentversions"),
-            storageclass=data.get("StorageClass") or data.get("storageclass"),
+        data = cls.casefold_keys(data)
+        return cls.pooled(
+            noncurrentdays=data.get("noncurrentdays"),
+            newernoncurrentversions=data.get("newernoncurrentversions"),
+            storageclass=data.get("storageclass"),
         )
 
     def __init__(
@@ -61,9 +64,14 @@ class NoncurrentVersionTransition(S3Configuration):
         newernoncurrentversions: int | str | None = None,
         storageclass: StorageClass | str | None = None,
     ) -> None:
-        self.noncurrentdays: int | None = self.resolve_days(noncurrentdays)
-        self.newernoncurrentversions: int | None = self.resolve_days(newernoncurrentversions)
+        self.noncurrentdays: int | None
+        self.newernoncurrentversions: int | None
+        self.noncurrentdays, self.newernoncurrentversions = self.resolve_days_pair(
+            noncurrentdays,
+            newernoncurrentversions,
+        )
         self.storageclass: StorageClass | None = self.resolve_storageclass(storageclass)
+        self._frozen = True
 
     def describe(self) -> dict[str, Any]:
         result = {}
@@ -52,21 +52,26 @@ class StorageClass(str, Enum):
     DEEP_ARCHIVE = "DEEP_ARCHIVE"
     GLACIER_IR = "GLACIER_IR"
 
+    def __new__(cls, value: str) -> StorageClass:
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        obj._lower = value.lower()
+        return obj
+
     @classmethod
     def from_str(cls, string: str) -> StorageClass:
-        for kind in StorageClass:
-            if kind.value.lower() == string.lower():
-                return kind
-        return StorageClass.STANDARD
+        # Exact (canonical or lowercase) spellings hit without allocating a lowered copy
+        member = _STORAGECLASS_LOOKUP.get(string)
+        if member is None:
+            member = _STORAGECLASS_LOOKUP.get(string.lower(), StorageClass.STANDARD)
+        return member
 
     @classmethod
     def from_any(cls, value: Any) -> StorageClass:
-        if isinstance(value, StorageClass):
+        if value.__class__ is StorageClass:
             return value
         if isinstance(value, str):
-            for member in cls:
-                if member.value.lower() == value.lower():
-                    return member
+            return cls.from_str(value)
         return StorageClass.STANDARD
 
     def __str__(self) -> str:
@@ -76,8 +81,16 @@ class StorageClass(str, Enum):
         return f"{self.__class__.__name__}.{self.name}"
 
     def __eq__(self, other) -> bool:
+        if other is self:
+            return True
+        if other.__class__ is StorageClass:
+            return False
         if isinstance(other, str):
-            return self.value.lower() == other.lower()
+            # Canonical and lowercase spellings resolve with one probe; mixed case falls back to lower()
+            member = _STORAGECLASS_LOOKUP.get(other)
+            if member is not None:
+                return member is self
+            return other.lower() == self._lower
         return super().__eq__(other)
 
     def __ne__(self, other) -> bool:
@@ -87,15 +100,27 @@ class StorageClass(str, Enum):
         return super().__hash__()
 
     def is_transitable(self) -> bool:
-        transitable_classes = [
-            StorageClass.GLACIER,
-            StorageClass.STANDARD_IA,
-            StorageClass.ONEZONE_IA,
-            StorageClass.INTELLIGENT_TIERING,
-            StorageClass.DEEP_ARCHIVE,
-            StorageClass.GLACIER_IR,
-        ]
-        return self in transitable_classes
+        # Precomputed per member from _TRANSITABLE; skips the Python-level __hash__/__eq__
+        return self._transitable
 
     def is_non_transitable(self) -> bool:
-        return self == StorageClass.STANDARD
+        return self is StorageClass.STANDARD
+
+
+_STORAGECLASS_LOOKUP: dict[str, StorageClass] = {
+    **{member.value: member for member in StorageClass},
+    **{member.value.lower(): member for member in StorageClass},
+}
+_TRANSITABLE: frozenset[StorageClass] = frozenset(
+    (
+        StorageClass.GLACIER,
+        StorageClass.STANDARD_IA,
+        StorageClass.ONEZONE_IA,
+        StorageClass.INTELLIGENT_TIERING,
+        StorageClass.DEEP_ARCHIVE,
+        StorageClass.GLACIER_IR,
+    )
+)
+for _member in StorageClass:
+    _member._transitable = _member in _TRANSITABLE
+del _member
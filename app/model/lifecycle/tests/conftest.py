@@ -0,0 +1,154 @@
+"""Shared fixtures for lifecycle tests."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from app.model.lifecycle.expiration import Expiration
+from app.model.lifecycle.filter import Filter
+from app.model.lifecycle.lifecycleconfiguration import LifecycleConfiguration
+from app.model.lifecycle.lifecyclerule import LifecycleRule
+from app.model.lifecycle.noncurrentversionexpiration import NoncurrentVersionExpiration
+from app.model.lifecycle.noncurrentversiontransition import NoncurrentVersionTransition
+
+# Fixtures below, except the raw payloads, are module or session scoped and shared
+# across tests without copying. Rules and their child components are frozen after
+# __init__, and describe/to_payload/to_dict build a new dict on every call, so those
+# are safe to share. LifecycleConfiguration is not frozen: add_rule/remove_rule on a
+# shared config would leak into later tests. A test that needs to mutate should
+# build its own instance.
+
+# Raw payloads are never handed out directly: payload fixtures return a fresh deep copy
+# per test and the parsed-config fixtures parse a copy, so nested dicts cannot leak
+_AWS_LIFECYCLE_PAYLOAD: dict[str, Any] = {
+    "Bucket": "my-bucket",
+    "ChecksumAlgorithm": "SHA256",
+    "LifecycleConfiguration": {"Rules": [{"ID": "test-rule", "Status": "Enabled"}]},
+    "ExpectedBucketOwner": "123456789012",
+    "TransitionDefaultMinimumObjectSize": "varies_by_storage_class",
+}
+_LOWERCASE_LIFECYCLE_PAYLOAD: dict[str, Any] = {
+    "bucket": "my-bucket",
+    "checksumalgorithm": "SHA1",
+    "lifecycleconfiguration": {"rules": [{"id": "test-rule", "status": "Enabled"}]},
+    "expectedbucketowner": "123456789012",
+    "transitiondefaultminimumobjectsize": "all_storage_classes_128K",
+}
+
+
+def _parse_unmutated(payload: Mapping[str, Any]) -> LifecycleConfiguration:
+    # Session-wide sharing of the parsed config is only safe if from_dict leaves its input alone
+    payload_copy = copy.deepcopy(payload)
+    config = LifecycleConfiguration.from_dict(payload_copy)
+    assert payload_copy == payload, "from_dict mutated input"
+    return config
+
+
+@pytest.fixture(scope="module")
+def all_fields_expiration() -> Expiration:
+    """Expiration with date, days and expired_object_delete_marker set."""
+    return Expiration(date="2026-12-31", days=30, expired_object_delete_marker=True)
+
+
+@pytest.fixture(scope="module")
+def all_fields_filter() -> Filter:
+    """Filter with prefix, tag and both object size bounds set."""
+    return Filter(
+        prefix="data/",
+        tag_key="Type",
+        tag_value="Archive",
+        object_size_greater_than=1024,
+        object_size_less_than=10485760,
+    )
+
+
+@pytest.fixture(scope="module")
+def basic_rule() -> LifecycleRule:
+    """Minimal enabled LifecycleRule with an explicit id."""
+    return LifecycleRule(id="test-rule", status="Enabled")
+
+
+@pytest.fixture(scope="module")
+def full_rule() -> LifecycleRule:
+    """LifecycleRule with every field set from dict inputs."""
+    return LifecycleRule(
+        id="test-rule",
+        prefix="logs/",
+        filter={"prefix": "data/"},
+        status="Enabled",
+        expiration={"days": 30},
+        transitions=[{"days": 30, "storageclass": "GLACIER"}],
+        noncurrent_transitions=[{"noncurrentdays": 30, "storageclass": "GLACIER"}],
+        noncurrent_expiration={"noncurrentdays": 90},
+        abort_incomplete_multipart_upload={"daysafterinitiation": 7},
+    )
+
+
+@pytest.fixture(scope="module")
+def noncurrentdays_expiration() -> NoncurrentVersionExpiration:
+    """NoncurrentVersionExpiration with only noncurrentdays set."""
+    return NoncurrentVersionExpiration(noncurrentdays=30)
+
+
+@pytest.fixture(scope="module")
+def both_fields_noncurrent_expiration() -> NoncurrentVersionExpiration:
+    """NoncurrentVersionExpiration with noncurrentdays and newernoncurrentversions set."""
+    return NoncurrentVersionExpiration(noncurrentdays=30, newernoncurrentversions=3)
+
+
+@pytest.fixture(scope="module")
+def glacier_noncurrent_transition() -> NoncurrentVersionTransition:
+    """NoncurrentVersionTransition to GLACIER after 30 noncurrent days."""
+    return NoncurrentVersionTransition(noncurrentdays=30, storageclass="GLACIER")
+
+
+@pytest.fixture(scope="module")
+def all_fields_noncurrent_transition() -> NoncurrentVersionTransition:
+    """NoncurrentVersionTransition with every field set."""
+    return NoncurrentVersionTransition(noncurrentdays=30, newernoncurrentversions=5, storageclass="DEEP_ARCHIVE")
+
+
+@pytest.fixture(scope="module")
+def config_with_rule(basic_rule: LifecycleRule) -> LifecycleConfiguration:
+    """LifecycleConfiguration holding only basic_rule."""
+    return LifecycleConfiguration(bucket="my-bucket", rules=[basic_rule])
+
+
+@pytest.fixture(scope="module")
+def sample_lifecycle_config(basic_rule: LifecycleRule) -> LifecycleConfiguration:
+    """LifecycleConfiguration with every top-level field and basic_rule set."""
+    return LifecycleConfiguration(
+        bucket="my-bucket",
+        checksumalgorithm="SHA256",
+        rules=[basic_rule],
+        expectedbucketowner="123456789012",
+        transitiondefaultminimumobjectsize="varies_by_storage_class",
+    )
+
+
+@pytest.fixture
+def aws_lifecycle_payload() -> dict[str, Any]:
+    """LifecycleConfiguration input in AWS (PascalCase) format; a fresh copy per test."""
+    return copy.deepcopy(_AWS_LIFECYCLE_PAYLOAD)
+
+
+@pytest.fixture(scope="session")
+def aws_lifecycle_config() -> LifecycleConfiguration:
+    """AWS-format payload parsed once per session."""
+    return _parse_unmutated(_AWS_LIFECYCLE_PAYLOAD)
+
+
+@pytest.fixture
+def lowercase_lifecycle_payload() -> dict[str, Any]:
+    """LifecycleConfiguration input in lowercase format; a fresh copy per test."""
+    return copy.deepcopy(_LOWERCASE_LIFECYCLE_PAYLOAD)
+
+
+@pytest.fixture(scope="session")
+def lowercase_lifecycle_config() -> LifecycleConfiguration:
+    """Lowercase-format payload parsed once per session."""
+    return _parse_unmutated(_LOWERCASE_LIFECYCLE_PAYLOAD)
@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
+
+import pytest
 
 from app.model.lifecycle.expiration import Expiration
 
+_TEST_DATE = date(2026, 12, 31)
+_TEST_DATE_STR = "2026-12-31"
+
+CASES = [
+    pytest.param({"days": 30}, {"days": 30}, {"Days": 30}, id="days"),
+    pytest.param({"date": _TEST_DATE}, {"date": _TEST_DATE_STR}, {"Date": _TEST_DATE}, id="date"),
+    pytest.param({"date": _TEST_DATE_STR}, {"date": _TEST_DATE_STR}, {"Date": _TEST_DATE}, id="date_string"),
+    pytest.param({}, {}, {}, id="no_fields"),
+]
+
 
 class TestExpiration:
     """Test Expiration configuration class."""
@@ -13,115 +25,82 @@ class TestExpiration:
     def test_init_with_days(self):
         """Test initialization with days."""
         exp = Expiration(days=30)
-        assert exp.days == 30
-        assert exp.date is None
-        assert exp.expired_object_delete_marker is None
+        assert (exp.date, exp.days, exp.expired_object_delete_marker) == (None, 30, None)
 
     def test_init_with_date(self):
         """Test initialization with date."""
-        test_date = date(2026, 12, 31)
-        exp = Expiration(date=test_date)
-        assert exp.date == test_date
+        exp = Expiration(date=_TEST_DATE)
+        assert exp.date == _TEST_DATE
         assert exp.days is None
 
+    def test_datetime_input_formats_as_date(self):
+        """Test a datetime input describes and serializes as YYYY-MM-DD without the time."""
+        exp = Expiration(date=datetime(2026, 12, 31, 5, 6))
+        assert exp.describe() == {"date": "2026-12-31"}
+        assert exp.to_dict()["date"] == "2026-12-31"
+        assert exp.get_fingerprint() == Expiration(date="2026-12-31").get_fingerprint()
+
     def test_init_with_date_string(self):
         """Test initialization with date string."""
-        exp = Expiration(date="2026-12-31")
-        assert exp.date == date(2026, 12, 31)
+        exp = Expiration(date=_TEST_DATE_STR)
+        assert exp.date == _TEST_DATE
         assert exp.days is None
 
     def test_init_with_expired_object_delete_marker(self):
         """Test initialization with expired_object_delete_marker."""
         exp = Expiration(expired_object_delete_marker=True)
-        assert exp.expired_object_delete_marker is True
-        assert exp.days is None
-        assert exp.date is None
+        assert (exp.date, exp.days, exp.expired_object_delete_marker) == (None, None, True)
 
     def test_init_with_all_parameters(self):
         """Test initialization with all parameters."""
-        exp = Expiration(date="2026-12-31", days=30, expired_object_delete_marker=True)
-        assert exp.date == date(2026, 12, 31)
-        assert exp.days == 30
-        assert exp.expired_object_delete_marker is True
+        exp = Expiration(date=_TEST_DATE_STR, days=30, expired_object_delete_marker=True)
+        assert (exp.date, exp.days, exp.expired_object_delete_marker) == (_TEST_DATE, 30, True)
 
     def test_from_dict_with_aws_format(self):
         """Test from_dict with AWS format (PascalCase)."""
-        data = {"Date": "2026-12-31", "Days": 30, "ExpiredObjectDeleteMarker": True}
+        data = {"Date": _TEST_DATE_STR, "Days": 30, "ExpiredObjectDeleteMarker": True}
         exp = Expiration.from_dict(data)
-        assert exp.date == date(2026, 12, 31)
-        assert exp.days == 30
-        assert exp.expired_object_delete_marker is True
+        assert (exp.date, exp.days, exp.expired_object_delete_marker) == (_TEST_DATE, 30, True)
 
     def test_from_dict_with_lowercase_format(self):
         """Test from_dict with lowercase format."""
-        data = {"date": "2026-12-31", "days": 30, "expiredobjectdeletemarker": False}
+        data = {"date": _TEST_DATE_STR, "days": 30, "expiredobjectdeletemarker": False}
         exp = Expiration.from_dict(data)
-        assert exp.date == date(2026, 12, 31)
-        assert exp.days == 30
-        assert exp.expired_object_delete_marker is False
+        assert (exp.date, exp.days, exp.expired_object_delete_marker) == (_TEST_DATE, 30, False)
 
     def test_from_dict_with_partial_data(self):
         """Test from_dict with partial data."""
         data = {"Days": 90}
         exp = Expiration.from_dict(data)
-        assert exp.days == 90
-        assert exp.date is None
-        assert exp.expired_object_delete_marker is None
+        assert (exp.date, exp.days, exp.expired_object_delete_marker) == (None, 90, None)
+
+    def test_from_dict_with_snake_case_format(self):
+        """Test from_dict accepts the snake_case keys emitted by to_dict."""
+        exp = Expiration.from_dict({"days": 30, "expired_object_delete_marker": True})
+        assert exp.days == 30
+        assert exp.expired_object_delete_marker is True
 
     def test_from_dict_with_empty_dict(self):
         """Test from_dict with empty dict."""
         exp = Expiration.from_dict({})
-        assert exp.date is None
-        assert exp.days is None
-        assert exp.expired_object_delete_marker is None
-
-    def test_describe_with_days(self):
-        """Test describe method with days."""
-        exp = Expiration(days=30)
-        result = exp.describe()
-        assert result == {"days": 30}
+        assert (exp.date, exp.days, exp.expired_object_delete_marker) == (None, None, None)
 
-    def test_describe_with_date(self):
-        """Test describe method with date."""
-        exp = Expiration(date="2026-12-31")
-        result = exp.describe()
-        assert result == {"date": "2026-12-31"}
+    @pytest.mark.parametrize("kwargs,expected_describe,expected_payload", CASES)
+    def test_expiration_projections(self, kwargs, expected_describe, expected_payload):
+        """Test describe and to_payload projections for field subsets."""
+        exp = Expiration(**kwargs)
+        assert exp.describe() == expected_describe
+        assert exp.to_payload() == expected_payload
 
-    def test_describe_with_all_fields(self):
+    def test_describe_with_all_fields(self, all_fields_expiration):
         """Test describe method with all fields."""
-        exp = Expiration(date="2026-12-31", days=30, expired_object_delete_marker=True)
-        result = exp.describe()
-        assert result["date"] == "2026-12-31"
-        assert result["days"] == 30
-        assert result["expired_object_delete_marker"] is True
-
-    def test_describe_with_no_fields(self):
-        """Test describe method with no fields set."""
-        exp = Expiration()
-        result = exp.describe()
-        assert result == {}
+        result = all_fields_expiration.describe()
+        assert result == {"date": _TEST_DATE_STR, "days": 30, "expired_object_delete_marker": True}
 
-    def test_to_payload_with_days(self):
-        """Test to_payload method with days."""
-        exp = Expiration(days=30)
-        result = exp.to_payload()
-        assert result == {"Days": 30}
-
-    def test_to_payload_with_date(self):
-        """Test to_payload method with date."""
-        test_date = date(2026, 12, 31)
-        exp = Expiration(date=test_date)
-        result = exp.to_payload()
-        assert result == {"Date": test_date}
-
-    def test_to_payload_with_all_fields(self):
+    def test_to_payload_with_all_fields(self, all_fields_expiration):
         """Test to_payload method with all fields."""
-        test_date = date(2026, 12, 31)
-        exp = Expiration(date=test_date, days=30, expired_object_delete_marker=True)
-        result = exp.to_payload()
-        assert result["Date"] == test_date
-        assert result["Days"] == 30
-        assert result["ExpiredObjectDeleteMarker"] is True
+        result = all_fields_expiration.to_payload()
+        assert result == {"Date": _TEST_DATE, "Days": 30, "ExpiredObjectDeleteMarker": True}
 
     def test_to_dict_with_days(self):
         """Test to_dict method with days."""
@@ -133,21 +112,19 @@ class TestExpiration:
 
     def test_to_dict_with_date(self):
         """Test to_dict method with date."""
-        exp = Expiration(date="2026-12-31")
+        exp = Expiration(date=_TEST_DATE_STR)
         result = exp.to_dict()
-        assert result["date"] == "2026-12-31"
+        assert result["date"] == _TEST_DATE_STR
         assert result["days"] is None
 
-    def test_to_dict_with_all_fields(self):
+    def test_to_dict_with_all_fields(self, all_fields_expiration):
         """Test to_dict method with all fields."""
-        exp = Expiration(date="2026-12-31", days=30, expired_object_delete_marker=False)
-        result = exp.to_dict()
-        assert result["date"] == "2026-12-31"
-        assert result["days"] == 30
-        assert result["expired_object_delete_marker"] is False
-
-    def test_days_as_string(self):
-        """Test initialization with days as string."""
-        exp = Expiration(days="30")
-        assert exp.days == 30
+        result = all_fields_expiration.to_dict()
+        assert result == {"date": _TEST_DATE_STR, "days": 30, "expired_object_delete_marker": True}
+
+    @pytest.mark.parametrize("raw,expected", [("30", 30), ("0", 0), ("999", 999)])
+    def test_days_coercion(self, raw, expected):
+        """Test initialization coerces string days to int."""
+        exp = Expiration(days=raw)
+        assert exp.days == expected
         assert isinstance(exp.days, int)
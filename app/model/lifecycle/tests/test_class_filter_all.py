@@ -2,8 +2,53 @@
 
 from __future__ import annotations
 
+import pytest
+
 from app.model.lifecycle.filter import Filter
 
+CASES = [
+    pytest.param(
+        {"prefix": "logs/"},
+        {"prefix": "logs/"},
+        {"Prefix": "logs/"},
+        id="prefix",
+    ),
+    pytest.param(
+        {"tag_key": "Environment", "tag_value": "Production"},
+        {"tag": {"key": "Environment", "value": "Production"}},
+        {"Tag": {"Key": "Environment", "Value": "Production"}},
+        id="tag",
+    ),
+    pytest.param(
+        {"object_size_greater_than": 1024, "object_size_less_than": 10485760},
+        {"object_size_greater_than": 1024, "object_size_less_than": 10485760},
+        {"ObjectSizeGreaterThan": 1024, "ObjectSizeLessThan": 10485760},
+        id="object_sizes",
+    ),
+    pytest.param(
+        {
+            "prefix": "data/",
+            "tag_key": "Type",
+            "tag_value": "Archive",
+            "object_size_greater_than": 1024,
+            "object_size_less_than": 10485760,
+        },
+        {
+            "prefix": "data/",
+            "tag": {"key": "Type", "value": "Archive"},
+            "object_size_greater_than": 1024,
+            "object_size_less_than": 10485760,
+        },
+        {
+            "Prefix": "data/",
+            "Tag": {"Key": "Type", "Value": "Archive"},
+            "ObjectSizeGreaterThan": 1024,
+            "ObjectSizeLessThan": 10485760,
+        },
+        id="all_fields",
+    ),
+]
+
 
 class TestFilter:
     """Test Filter configuration class."""
@@ -108,40 +153,12 @@ class TestFilter:
         assert filt.tag_key is None
         assert filt.tag_value is None
 
-    def test_describe_with_prefix(self):
-        """Test describe method with prefix."""
-        filt = Filter(prefix="logs/")
-        result = filt.describe()
-        assert result == {"prefix": "logs/"}
-
-    def test_describe_with_tag(self):
-        """Test describe method with tag."""
-        filt = Filter(tag_key="Environment", tag_value="Production")
-        result = filt.describe()
-        assert result == {"tag": {"key": "Environment", "value": "Production"}}
-
-    def test_describe_with_object_sizes(self):
-        """Test describe method with object sizes."""
-        filt = Filter(object_size_greater_than=1024, object_size_less_than=10485760)
-        result = filt.describe()
-        assert result["object_size_greater_than"] == 1024
-        assert result["object_size_less_than"] == 10485760
-
-    def test_describe_with_all_fields(self):
-        """Test describe method with all fields."""
-        filt = Filter(
-            prefix="data/",
-            tag_key="Type",
-            tag_value="Archive",
-            object_size_greater_than=1024,
-            object_size_less_than=10485760,
-        )
-        result = filt.describe()
-        assert result["prefix"] == "data/"
-        assert result["tag"]["key"] == "Type"
-        assert result["tag"]["value"] == "Archive"
-        assert result["object_size_greater_than"] == 1024
-        assert result["object_size_less_than"] == 10485760
+    @pytest.mark.parametrize("kwargs,expected_describe,expected_payload", CASES)
+    def test_filter_projections(self, kwargs, expected_describe, expected_payload):
+        """Test describe and to_payload projections for field subsets."""
+        filt = Filter(**kwargs)
+        assert filt.describe() == expected_describe
+        assert filt.to_payload() == expected_payload
 
     def test_describe_with_no_tag_returns_no_tag(self):
         """Test describe method returns no tag if keys are None."""
@@ -149,41 +166,6 @@ class TestFilter:
         result = filt.describe()
         assert "tag" not in result
 
-    def test_to_payload_with_prefix(self):
-        """Test to_payload method with prefix."""
-        filt = Filter(prefix="logs/")
-        result = filt.to_payload()
-        assert result == {"Prefix": "logs/"}
-
-    def test_to_payload_with_tag(self):
-        """Test to_payload method with tag."""
-        filt = Filter(tag_key="Environment", tag_value="Production")
-        result = filt.to_payload()
-        assert result == {"Tag": {"Key": "Environment", "Value": "Production"}}
-
-    def test_to_payload_with_object_sizes(self):
-        """Test to_payload method with object sizes."""
-        filt = Filter(object_size_greater_than=1024, object_size_less_than=10485760)
-        result = filt.to_payload()
-        assert result["ObjectSizeGreaterThan"] == 1024
-        assert result["ObjectSizeLessThan"] == 10485760
-
-    def test_to_payload_with_all_fields(self):
-        """Test to_payload method with all fields."""
-        filt = Filter(
-            prefix="data/",
-            tag_key="Type",
-            tag_value="Archive",
-            object_size_greater_than=1024,
-            object_size_less_than=10485760,
-        )
-        result = filt.to_payload()
-        assert result["Prefix"] == "data/"
-        assert result["Tag"]["Key"] == "Type"
-        assert result["Tag"]["Value"] == "Archive"
-        assert result["ObjectSizeGreaterThan"] == 1024
-        assert result["ObjectSizeLessThan"] == 10485760
-
     def test_to_dict_with_prefix(self):
         """Test to_dict method with prefix."""
         filt = Filter(prefix="logs/")
@@ -199,21 +181,15 @@ class TestFilter:
         assert result["tag"]["key"] == "Environment"
         assert result["tag"]["value"] == "Production"
 
-    def test_to_dict_with_all_fields(self):
+    def test_to_dict_with_all_fields(self, all_fields_filter):
         """Test to_dict method with all fields."""
-        filt = Filter(
-            prefix="data/",
-            tag_key="Type",
-            tag_value="Archive",
-            object_size_greater_than=1024,
-            object_size_less_than=10485760,
-        )
-        result = filt.to_dict()
-        assert result["prefix"] == "data/"
-        assert result["tag"]["key"] == "Type"
-        assert result["tag"]["value"] == "Archive"
-        assert result["object_size_greater_than"] == 1024
-        assert result["object_size_less_than"] == 10485760
+        result = all_fields_filter.to_dict()
+        assert result == {
+            "prefix": "data/",
+            "tag": {"key": "Type", "value": "Archive"},
+            "object_size_greater_than": 1024,
+            "object_size_less_than": 10485760,
+        }
 
     def test_empty_prefix(self):
         """Test with empty prefix string."""
@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
+import pytest
+
 from app.model.lifecycle.lifecycleconfiguration import LifecycleConfiguration
 from app.model.lifecycle.lifecyclerule import LifecycleRule
 
+_COMPLEX_RULES = [
+    {"ID": "rule-1", "Status": "Enabled", "Expiration": {"Days": 30}},
+    {"ID": "rule-2", "Status": "Enabled", "Transitions": [{"Days": 90, "StorageClass": "GLACIER"}]},
+    {
+        "ID": "rule-3",
+        "Status": "Disabled",
+        "NoncurrentVersionExpiration": {"NoncurrentDays": 30},
+    },
+]
+
 
 class TestLifecycleConfiguration:
     """Test LifecycleConfiguration configuration class."""
@@ -18,25 +30,22 @@ class TestLifecycleConfiguration:
         assert config.expectedbucketowner is None
         assert config.transitiondefaultminimumobjectsize is None
 
-    def test_init_with_bucket_and_rules(self):
+    def test_init_with_bucket_and_rules(self, config_with_rule):
         """Test initialization with bucket and rules."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
-        config = LifecycleConfiguration(bucket="my-bucket", rules=[rule])
-        assert config.bucket == "my-bucket"
-        assert len(config.rules) == 1
-        assert list(config.rules.values())[0].id == "test-rule"
+        assert config_with_rule.bucket == "my-bucket"
+        assert len(config_with_rule.rules) == 1
+        assert list(config_with_rule.rules.values())[0].id == "test-rule"
 
     def test_init_with_checksum_algorithm(self):
         """Test initialization with checksum algorithm."""
         config = LifecycleConfiguration(bucket="my-bucket", checksumalgorithm="SHA256")
         assert config.checksumalgorithm == "SHA256"
 
-    def test_init_with_all_checksum_algorithms(self):
+    @pytest.mark.parametrize("algo", ["CRC32", "CRC32C", "SHA1", "SHA256"])
+    def test_init_with_all_checksum_algorithms(self, algo):
         """Test initialization with all checksum algorithms."""
-        algorithms = ["CRC32", "CRC32C", "SHA1", "SHA256"]
-        for algo in algorithms:
-            config = LifecycleConfiguration(bucket="my-bucket", checksumalgorithm=algo)
-            assert config.checksumalgorithm == algo
+        config = LifecycleConfiguration(bucket="my-bucket", checksumalgorithm=algo)
+        assert config.checksumalgorithm == algo
 
     def test_init_with_expected_bucket_owner(self):
         """Test initialization with expected bucket owner."""
@@ -50,12 +59,11 @@ class TestLifecycleConfiguration:
         )
         assert config.transitiondefaultminimumobjectsize == "all_storage_classes_128K"
 
-    def test_init_with_all_transition_default_options(self):
+    @pytest.mark.parametrize("option", ["varies_by_storage_class", "all_storage_classes_128K"])
+    def test_init_with_all_transition_default_options(self, option):
         """Test initialization with all transition default options."""
-        options = ["varies_by_storage_class", "all_storage_classes_128K"]
-        for option in options:
-            config = LifecycleConfiguration(bucket="my-bucket", transitiondefaultminimumobjectsize=option)
-            assert config.transitiondefaultminimumobjectsize == option
+        config = LifecycleConfiguration(bucket="my-bucket", transitiondefaultminimumobjectsize=option)
+        assert config.transitiondefaultminimumobjectsize == option
 
     def test_init_with_rules_as_objects(self):
         """Test initialization with rules as LifecycleRule objects."""
@@ -63,25 +71,27 @@ class TestLifecycleConfiguration:
         rule2 = LifecycleRule(id="rule-2", status="Disabled")
         config = LifecycleConfiguration(bucket="my-bucket", rules=[rule1, rule2])
         assert len(config.rules) == 2
-        assert list(config.rules.values())[0].id == "rule-1"
-        assert list(config.rules.values())[1].id == "rule-2"
+        rules = list(config.rules.values())
+        assert rules[0].id == "rule-1"
+        assert rules[1].id == "rule-2"
 
     def test_init_with_rules_as_dicts(self):
         """Test initialization with rules as dicts."""
         rules = [{"id": "rule-1", "status": "Enabled"}, {"id": "rule-2", "status": "Disabled"}]
         config = LifecycleConfiguration(bucket="my-bucket", rules=rules)
         assert len(config.rules) == 2
-        assert all(isinstance(rule, LifecycleRule) for rule in config.rules.values())
-        assert list(config.rules.values())[0].id == "rule-1"
-        assert list(config.rules.values())[1].id == "rule-2"
+        rules = list(config.rules.values())
+        assert isinstance(rules[0], LifecycleRule)
+        assert isinstance(rules[1], LifecycleRule)
+        assert rules[0].id == "rule-1"
+        assert rules[1].id == "rule-2"
 
-    def test_init_with_all_parameters(self):
+    def test_init_with_all_parameters(self, basic_rule):
         """Test initialization with all parameters."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
         config = LifecycleConfiguration(
             bucket="my-bucket",
             checksumalgorithm="SHA256",
-            rules=[rule],
+            rules=[basic_rule],
             expectedbucketowner="123456789012",
             transitiondefaultminimumobjectsize="varies_by_storage_class",
         )
@@ -91,16 +101,9 @@ class TestLifecycleConfiguration:
         assert config.expectedbucketowner == "123456789012"
         assert config.transitiondefaultminimumobjectsize == "varies_by_storage_class"
 
-    def test_from_dict_with_aws_format(self):
+    def test_from_dict_with_aws_format(self, aws_lifecycle_config):
         """Test from_dict with AWS format (PascalCase)."""
-        data = {
-            "Bucket": "my-bucket",
-            "ChecksumAlgorithm": "SHA256",
-            "LifecycleConfiguration": {"Rules": [{"ID": "test-rule", "Status": "Enabled"}]},
-            "ExpectedBucketOwner": "123456789012",
-            "TransitionDefaultMinimumObjectSize": "varies_by_storage_class",
-        }
-        config = LifecycleConfiguration.from_dict(data)
+        config = aws_lifecycle_config
         assert config.bucket == "my-bucket"
         assert config.checksumalgorithm == "SHA256"
         assert len(config.rules) == 1
@@ -108,16 +111,9 @@ class TestLifecycleConfiguration:
         assert config.expectedbucketowner == "123456789012"
         assert config.transitiondefaultminimumobjectsize == "varies_by_storage_class"
 
-    def test_from_dict_with_lowercase_format(self):
+    def test_from_dict_with_lowercase_format(self, lowercase_lifecycle_config):
         """Test from_dict with lowercase format."""
-        data = {
-            "bucket": "my-bucket",
-            "checksumalgorithm": "SHA1",
-            "lifecycleconfiguration": {"rules": [{"id": "test-rule", "status": "Enabled"}]},
-            "expectedbucketowner": "123456789012",
-            "transitiondefaultminimumobjectsize": "all_storage_classes_128K",
-        }
-        config = LifecycleConfiguration.from_dict(data)
+        config = lowercase_lifecycle_config
         assert config.bucket == "my-bucket"
         assert config.checksumalgorithm == "SHA1"
         assert len(config.rules) == 1
@@ -159,32 +155,24 @@ class TestLifecycleConfiguration:
         assert "expectedbucketowner" not in result
         assert "transitiondefaultminimumobjectsize" not in result
 
-    def test_describe_with_rules(self):
+    def test_describe_with_rules(self, config_with_rule):
         """Test describe method with rules."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
-        config = LifecycleConfiguration(bucket="my-bucket", rules=[rule])
-        result = config.describe()
+        result = config_with_rule.describe()
         assert result["bucket"] == "my-bucket"
         assert "lifecycleconfiguration" in result
         assert "rules" in result["lifecycleconfiguration"]
         assert len(result["lifecycleconfiguration"]["rules"]) == 1
 
-    def test_describe_with_all_fields(self):
+    def test_describe_with_all_fields(self, sample_lifecycle_config):
         """Test describe method with all fields."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
-        config = LifecycleConfiguration(
-            bucket="my-bucket",
-            checksumalgorithm="SHA256",
-            rules=[rule],
-            expectedbucketowner="123456789012",
-            transitiondefaultminimumobjectsize="varies_by_storage_class",
-        )
-        result = config.describe()
-        assert result["bucket"] == "my-bucket"
-        assert result["checksumalgorithm"] == "SHA256"
-        assert "lifecycleconfiguration" in result
-        assert result["expectedbucketowner"] == "123456789012"
-        assert result["transitiondefaultminimumobjectsize"] == "varies_by_storage_class"
+        result = sample_lifecycle_config.describe()
+        assert result == {
+            "bucket": "my-bucket",
+            "checksumalgorithm": "SHA256",
+            "lifecycleconfiguration": {"rules": [{"status": "Enabled"}]},
+            "expectedbucketowner": "123456789012",
+            "transitiondefaultminimumobjectsize": "varies_by_storage_class",
+        }
 
     def test_to_payload_with_minimal_fields(self):
         """Test to_payload method with minimal fields."""
@@ -196,33 +184,25 @@ class TestLifecycleConfiguration:
         assert "ExpectedBucketOwner" not in result
         assert "TransitionDefaultMinimumObjectSize" not in result
 
-    def test_to_payload_with_rules(self):
+    def test_to_payload_with_rules(self, config_with_rule):
         """Test to_payload method with rules."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
-        config = LifecycleConfiguration(bucket="my-bucket", rules=[rule])
-        result = config.to_payload()
+        result = config_with_rule.to_payload()
         assert result["Bucket"] == "my-bucket"
         assert "LifecycleConfiguration" in result
         assert "Rules" in result["LifecycleConfiguration"]
         assert len(result["LifecycleConfiguration"]["Rules"]) == 1
         assert result["LifecycleConfiguration"]["Rules"][0]["ID"] == "test-rule"
 
-    def test_to_payload_with_all_fields(self):
+    def test_to_payload_with_all_fields(self, sample_lifecycle_config):
         """Test to_payload method with all fields."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
-        config = LifecycleConfiguration(
-            bucket="my-bucket",
-            checksumalgorithm="SHA256",
-            rules=[rule],
-            expectedbucketowner="123456789012",
-            transitiondefaultminimumobjectsize="varies_by_storage_class",
-        )
-        result = config.to_payload()
-        assert result["Bucket"] == "my-bucket"
-        assert result["ChecksumAlgorithm"] == "SHA256"
-        assert "LifecycleConfiguration" in result
-        assert result["ExpectedBucketOwner"] == "123456789012"
-        assert result["TransitionDefaultMinimumObjectSize"] == "varies_by_storage_class"
+        result = sample_lifecycle_config.to_payload()
+        assert result == {
+            "Bucket": "my-bucket",
+            "ChecksumAlgorithm": "SHA256",
+            "LifecycleConfiguration": {"Rules": [{"ID": "test-rule", "Status": "Enabled"}]},
+            "ExpectedBucketOwner": "123456789012",
+            "TransitionDefaultMinimumObjectSize": "varies_by_storage_class",
+        }
 
     def test_to_dict_with_minimal_fields(self):
         """Test to_dict method with minimal fields."""
@@ -235,32 +215,24 @@ class TestLifecycleConfiguration:
         assert result["expectedbucketowner"] is None
         assert result["transitiondefaultminimumobjectsize"] is None
 
-    def test_to_dict_with_rules(self):
+    def test_to_dict_with_rules(self, config_with_rule):
         """Test to_dict method with rules."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
-        config = LifecycleConfiguration(bucket="my-bucket", rules=[rule])
-        result = config.to_dict()
+        result = config_with_rule.to_dict()
         assert result["bucket"] == "my-bucket"
         assert "lifecycleconfiguration" in result
         assert len(result["lifecycleconfiguration"]["rules"]) == 1
         assert result["lifecycleconfiguration"]["rules"][0]["id"] == "test-rule"
 
-    def test_to_dict_with_all_fields(self):
+    def test_to_dict_with_all_fields(self, sample_lifecycle_config):
         """Test to_dict method with all fields."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
-        config = LifecycleConfiguration(
-            bucket="my-bucket",
-            checksumalgorithm="SHA256",
-            rules=[rule],
-            expectedbucketowner="123456789012",
-            transitiondefaultminimumobjectsize="varies_by_storage_class",
-        )
-        result = config.to_dict()
-        assert result["bucket"] == "my-bucket"
-        assert result["checksumalgorithm"] == "SHA256"
-        assert len(result["lifecycleconfiguration"]["rules"]) == 1
-        assert result["expectedbucketowner"] == "123456789012"
-        assert result["transitiondefaultminimumobjectsize"] == "varies_by_storage_class"
+        result = sample_lifecycle_config.to_dict()
+        assert result == {
+            "bucket": "my-bucket",
+            "checksumalgorithm": "SHA256",
+            "lifecycleconfiguration": {"rules": [{"id": "test-rule", "status": "Enabled"}]},
+            "expectedbucketowner": "123456789012",
+            "transitiondefaultminimumobjectsize": "varies_by_storage_class",
+        }
 
     def test_resolve_rules_with_none(self):
         """Test _resolve_rules with None."""
@@ -273,44 +245,37 @@ class TestLifecycleConfiguration:
         rule_dict = {"id": "rule-2", "status": "Disabled"}
         config = LifecycleConfiguration(bucket="my-bucket", rules=[rule_obj, rule_dict])
         assert len(config.rules) == 2
-        assert all(isinstance(rule, LifecycleRule) for rule in config.rules.values())
-        assert list(config.rules.values())[0].id == "rule-1"
-        assert list(config.rules.values())[1].id == "rule-2"
+        rules = list(config.rules.values())
+        assert isinstance(rules[0], LifecycleRule)
+        assert isinstance(rules[1], LifecycleRule)
+        assert rules[0].id == "rule-1"
+        assert rules[1].id == "rule-2"
 
     def test_complex_configuration_with_multiple_rules(self):
         """Test complex configuration with multiple rules."""
-        rules = [
-            {"ID": "rule-1", "Status": "Enabled", "Expiration": {"Days": 30}},
-            {"ID": "rule-2", "Status": "Enabled", "Transitions": [{"Days": 90, "StorageClass": "GLACIER"}]},
-            {
-                "ID": "rule-3",
-                "Status": "Disabled",
-                "NoncurrentVersionExpiration": {"NoncurrentDays": 30},
-            },
-        ]
         config = LifecycleConfiguration(
             bucket="my-bucket",
             checksumalgorithm="SHA256",
-            rules=rules,
+            rules=_COMPLEX_RULES,
             expectedbucketowner="123456789012",
             transitiondefaultminimumobjectsize="varies_by_storage_class",
         )
         assert len(config.rules) == 3
-        assert list(config.rules.values())[0].id == "rule-1"
-        assert list(config.rules.values())[0].expiration.days == 30
-        assert list(config.rules.values())[1].id == "rule-2"
-        assert len(list(config.rules.values())[1].transitions) == 1
-        assert list(config.rules.values())[2].id == "rule-3"
-        assert list(config.rules.values())[2].noncurrent_expiration.noncurrentdays == 30
-
-    def test_bucket_name_variations(self):
+        rules = list(config.rules.values())
+        assert rules[0].id == "rule-1"
+        assert rules[0].expiration.days == 30
+        assert rules[1].id == "rule-2"
+        assert len(rules[1].transitions) == 1
+        assert rules[2].id == "rule-3"
+        assert rules[2].noncurrent_expiration.noncurrentdays == 30
+
+    @pytest.mark.parametrize("bucket_name", ["my-bucket", "my.bucket", "my-bucket-123", "bucket123"])
+    def test_bucket_name_variations(self, bucket_name):
         """Test with various bucket name patterns."""
-        bucket_names = ["my-bucket", "my.bucket", "my-bucket-123", "bucket123"]
-        for bucket_name in bucket_names:
-            config = LifecycleConfiguration(bucket=bucket_name)
-            assert config.bucket == bucket_name
-            result = config.to_payload()
-            assert result["Bucket"] == bucket_name
+        config = LifecycleConfiguration(bucket=bucket_name)
+        assert config.bucket == bucket_name
+        result = config.to_payload()
+        assert result["Bucket"] == bucket_name
 
     def test_empty_rules_list(self):
         """Test with empty rules list."""
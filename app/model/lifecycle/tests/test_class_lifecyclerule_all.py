@@ -2,21 +2,110 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import sys
+from collections import OrderedDict
+from functools import partial
+
+import pytest
+
 from app.model.lifecycle.abortincompletemultipartupload import AbortIncompleteMultipartUpload
+from app.model.lifecycle.common import _POOL_LOCK
 from app.model.lifecycle.expiration import Expiration
 from app.model.lifecycle.filter import Filter
 from app.model.lifecycle.lifecyclerule import LifecycleRule
 from app.model.lifecycle.noncurrentversionexpiration import NoncurrentVersionExpiration
 from app.model.lifecycle.noncurrentversiontransition import NoncurrentVersionTransition
+from app.model.lifecycle.storageclass import StorageClass
 from app.model.lifecycle.transition import Transition
 
+_mkrule = partial(LifecycleRule, id="test-rule", status="Enabled")
+
+CASINGS = [
+    pytest.param(
+        {
+            "ID": "test-rule",
+            "Status": "Enabled",
+            "Prefix": "logs/",
+            "Filter": {"Prefix": "data/"},
+            "Expiration": {"Days": 30},
+            "Transitions": [{"Days": 30, "StorageClass": "GLACIER"}],
+            "NoncurrentVersionTransitions": [{"NoncurrentDays": 30, "StorageClass": "GLACIER"}],
+            "NoncurrentVersionExpiration": {"NoncurrentDays": 90},
+            "AbortIncompleteMultipartUpload": {"DaysAfterInitiation": 7},
+        },
+        id="aws",
+    ),
+    pytest.param(
+        {
+            "id": "test-rule",
+            "status": "Enabled",
+            "prefix": "logs/",
+            "filter": {"prefix": "data/"},
+            "expiration": {"days": 30},
+            "transitions": [{"days": 30, "storageclass": "GLACIER"}],
+            "noncurrent_transitions": [{"noncurrentdays": 30, "storageclass": "GLACIER"}],
+            "noncurrent_expiration": {"noncurrentdays": 90},
+            "abort_incomplete_multipart_upload": {"daysafterinitiation": 7},
+        },
+        id="lower",
+    ),
+]
+
+
+# Expected projections of the conftest full_rule fixture
+_EXPECTED_DESCRIBE = {
+    "prefix": "logs/",
+    "filter": {"prefix": "data/"},
+    "status": "Enabled",
+    "expiration": {"days": 30},
+    "transitions": [{"days": 30, "storageclass": "GLACIER"}],
+    "noncurrent_transitions": [{"noncurrentdays": 30, "storageclass": "GLACIER"}],
+    "noncurrent_expiration": {"noncurrentdays": 90},
+    "abort_incomplete_multipart_upload": {"daysafterinitiation": 7},
+}
+
+_EXPECTED_PAYLOAD = {
+    "ID": "test-rule",
+    "Filter": {"Prefix": "data/"},
+    "Prefix": "logs/",
+    "Status": "Enabled",
+    "Expiration": {"Days": 30},
+    "Transitions": [{"Days": 30, "StorageClass": "GLACIER"}],
+    "NoncurrentVersionTransitions": [{"NoncurrentDays": 30, "StorageClass": "GLACIER"}],
+    "NoncurrentVersionExpiration": {"NoncurrentDays": 90},
+    "AbortIncompleteMultipartUpload": {"DaysAfterInitiation": 7},
+}
+_EXPECTED_PAYLOAD_JSON = json.dumps(_EXPECTED_PAYLOAD, separators=(",", ":")).encode()
+
+
+_EXPECTED_DICT = {
+    "id": "test-rule",
+    "prefix": "logs/",
+    "filter": {
+        "prefix": "data/",
+        "tag": {"key": None, "value": None},
+        "object_size_greater_than": None,
+        "object_size_less_than": None,
+    },
+    "status": "Enabled",
+    "expiration": {"date": None, "days": 30, "expired_object_delete_marker": None},
+    "transitions": [{"date": None, "days": 30, "storageclass": "GLACIER"}],
+    "noncurrent_transitions": [
+        {"noncurrentdays": 30, "newernoncurrentversions": None, "storageclass": "GLACIER"},
+    ],
+    "noncurrent_expiration": {"noncurrentdays": 90, "newernoncurrentversions": None},
+    "abort_incomplete_multipart_upload": {"daysafterinitiation": 7},
+}
+
 
 class TestLifecycleRule:
     """Test LifecycleRule configuration class."""
 
     def test_init_with_minimal_parameters(self):
         """Test initialization with minimal parameters."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
+        rule = _mkrule()
         assert rule.id == "test-rule"
         assert rule.status == "Enabled"
         assert rule.prefix is None
@@ -29,93 +118,85 @@ class TestLifecycleRule:
 
     def test_init_with_prefix(self):
         """Test initialization with prefix."""
-        rule = LifecycleRule(id="test-rule", prefix="logs/", status="Enabled")
+        rule = _mkrule(prefix="logs/")
         assert rule.prefix == "logs/"
 
     def test_init_with_filter_object(self):
         """Test initialization with Filter object."""
         filt = Filter(prefix="data/")
-        rule = LifecycleRule(id="test-rule", filter=filt, status="Enabled")
+        rule = _mkrule(filter=filt)
         assert rule.filter == filt
         assert rule.filter.prefix == "data/"
 
     def test_init_with_filter_dict(self):
         """Test initialization with filter dict."""
-        rule = LifecycleRule(id="test-rule", filter={"prefix": "logs/"}, status="Enabled")
-        assert isinstance(rule.filter, Filter)
+        rule = _mkrule(filter={"prefix": "logs/"})
+        assert type(rule.filter) is Filter
         assert rule.filter.prefix == "logs/"
 
     def test_init_with_expiration_object(self):
         """Test initialization with Expiration object."""
         exp = Expiration(days=30)
-        rule = LifecycleRule(id="test-rule", expiration=exp, status="Enabled")
+        rule = _mkrule(expiration=exp)
         assert rule.expiration == exp
         assert rule.expiration.days == 30
 
     def test_init_with_expiration_dict(self):
         """Test initialization with expiration dict."""
-        rule = LifecycleRule(id="test-rule", expiration={"days": 30}, status="Enabled")
-        assert isinstance(rule.expiration, Expiration)
+        rule = _mkrule(expiration={"days": 30})
+        assert type(rule.expiration) is Expiration
         assert rule.expiration.days == 30
 
     def test_init_with_transitions_list_of_objects(self):
         """Test initialization with transitions list of objects."""
         trans1 = Transition(days=30, storageclass="STANDARD_IA")
         trans2 = Transition(days=90, storageclass="GLACIER")
-        rule = LifecycleRule(id="test-rule", transitions=[trans1, trans2], status="Enabled")
+        rule = _mkrule(transitions=[trans1, trans2])
         assert len(rule.transitions) == 2
         assert rule.transitions[0].days == 30
         assert rule.transitions[1].days == 90
 
     def test_init_with_transitions_list_of_dicts(self):
         """Test initialization with transitions list of dicts."""
-        rule = LifecycleRule(
-            id="test-rule",
-            transitions=[{"days": 30, "storageclass": "STANDARD_IA"}, {"days": 90, "storageclass": "GLACIER"}],
-            status="Enabled",
+        rule = _mkrule(
+            transitions=[{"days": 30, "storageclass": "STANDARD_IA"}, {"days": 90, "storageclass": "GLACIER"}]
         )
         assert len(rule.transitions) == 2
-        assert all(isinstance(t, Transition) for t in rule.transitions)
+        assert all(type(t) is Transition for t in rule.transitions)
         assert rule.transitions[0].days == 30
         assert rule.transitions[1].days == 90
 
     def test_init_with_noncurrent_transitions(self):
         """Test initialization with noncurrent version transitions."""
-        rule = LifecycleRule(
-            id="test-rule",
-            noncurrent_transitions=[{"noncurrentdays": 30, "storageclass": "STANDARD_IA"}],
-            status="Enabled",
-        )
+        rule = _mkrule(noncurrent_transitions=[{"noncurrentdays": 30, "storageclass": "STANDARD_IA"}])
         assert len(rule.noncurrent_transitions) == 1
-        assert isinstance(rule.noncurrent_transitions[0], NoncurrentVersionTransition)
+        assert type(rule.noncurrent_transitions[0]) is NoncurrentVersionTransition
         assert rule.noncurrent_transitions[0].noncurrentdays == 30
 
     def test_init_with_noncurrent_expiration_object(self):
         """Test initialization with NoncurrentVersionExpiration object."""
         nve = NoncurrentVersionExpiration(noncurrentdays=30)
-        rule = LifecycleRule(id="test-rule", noncurrent_expiration=nve, status="Enabled")
+        rule = _mkrule(noncurrent_expiration=nve)
         assert rule.noncurrent_expiration == nve
         assert rule.noncurrent_expiration.noncurrentdays == 30
 
     def test_init_with_noncurrent_expiration_dict(self):
         """Test initialization with noncurrent expiration dict."""
-        rule = LifecycleRule(id="test-rule", noncurrent_expiration={"noncurrentdays": 30}, status="Enabled")
-        assert isinstance(rule.noncurrent_expiration, NoncurrentVersionExpiration)
+        rule = _mkrule(noncurrent_expiration={"noncurrentdays": 30})
+        assert type(rule.noncurrent_expiration) is NoncurrentVersionExpiration
         assert rule.noncurrent_expiration.noncurrentdays == 30
 
     def test_init_with_abort_incomplete_multipart_upload_object(self):
         """Test initialization with AbortIncompleteMultipartUpload object."""
         aimu = AbortIncompleteMultipartUpload(daysafterinitiation=7)
-        rule = LifecycleRule(id="test-rule", abort_incomplete_multipart_upload=aimu, status="Enabled")
+        rule = _mkrule(abort_incomplete_multipart_upload=aimu)
         assert rule.abort_incomplete_multipart_upload == aimu
         assert rule.abort_incomplete_multipart_upload.daysafterinitiation == 7
 
     def test_init_with_abort_incomplete_multipart_upload_dict(self):
         """Test initialization with abort incomplete multipart upload dict."""
-        rule = LifecycleRule(
-            id="test-rule", abort_incomplete_multipart_upload={"daysafterinitiation": 7}, status="Enabled"
-        )
-        assert isinstance(rule.abort_incomplete_multipart_upload, AbortIncompleteMultipartUpload)
+        rule = _mkrule(abort_incomplete_multipart_upload={"daysafterinitiation": 7})
+        assert type(rule.abort_incomplete_multipart_upload) is AbortIncompleteMultipartUpload
         assert rule.abort_incomplete_multipart_upload.daysafterinitiation == 7
 
     def test_init_with_disabled_status(self):
@@ -123,53 +204,21 @@ class TestLifecycleRule:
         rule = LifecycleRule(id="test-rule", status="Disabled")
         assert rule.status == "Disabled"
 
-    def test_from_dict_with_aws_format(self):
-        """Test from_dict with AWS format (PascalCase)."""
-        data = {
-            "ID": "test-rule",
-            "Status": "Enabled",
-            "Prefix": "logs/",
-            "Filter": {"Prefix": "data/"},
-            "Expiration": {"Days": 30},
-            "Transitions": [{"Days": 30, "StorageClass": "GLACIER"}],
-            "NoncurrentVersionTransitions": [{"NoncurrentDays": 30, "StorageClass": "GLACIER"}],
-            "NoncurrentVersionExpiration": {"NoncurrentDays": 90},
-            "AbortIncompleteMultipartUpload": {"DaysAfterInitiation": 7},
-        }
-        rule = LifecycleRule.from_dict(data)
-        assert rule.id == "test-rule"
-        assert rule.status == "Enabled"
-        assert rule.prefix == "logs/"
-        assert isinstance(rule.filter, Filter)
-        assert isinstance(rule.expiration, Expiration)
-        assert len(rule.transitions) == 1
-        assert len(rule.noncurrent_transitions) == 1
-        assert isinstance(rule.noncurrent_expiration, NoncurrentVersionExpiration)
-        assert isinstance(rule.abort_incomplete_multipart_upload, AbortIncompleteMultipartUpload)
-
-    def test_from_dict_with_lowercase_format(self):
-        """Test from_dict with lowercase format."""
-        data = {
-            "id": "test-rule",
-            "status": "Enabled",
-            "prefix": "logs/",
-            "filter": {"prefix": "data/"},
-            "expiration": {"days": 30},
-            "transitions": [{"days": 30, "storageclass": "GLACIER"}],
-            "noncurrent_transitions": [{"noncurrentdays": 30, "storageclass": "GLACIER"}],
-            "noncurrent_expiration": {"noncurrentdays": 90},
-            "abort_incomplete_multipart_upload": {"daysafterinitiation": 7},
-        }
+    @pytest.mark.parametrize("data", CASINGS)
+    def test_from_dict_key_casing(self, data):
+        """Test from_dict with AWS (PascalCase) and lowercase keys."""
         rule = LifecycleRule.from_dict(data)
         assert rule.id == "test-rule"
         assert rule.status == "Enabled"
         assert rule.prefix == "logs/"
-        assert isinstance(rule.filter, Filter)
-        assert isinstance(rule.expiration, Expiration)
-        assert len(rule.transitions) == 1
-        assert len(rule.noncurrent_transitions) == 1
-        assert isinstance(rule.noncurrent_expiration, NoncurrentVersionExpiration)
-        assert isinstance(rule.abort_incomplete_multipart_upload, AbortIncompleteMultipartUpload)
+        assert type(rule.filter) is Filter
+        assert type(rule.expiration) is Expiration
+        assert [t.to_payload() for t in rule.transitions] == [{"Days": 30, "StorageClass": "GLACIER"}]
+        assert [t.to_payload() for t in rule.noncurrent_transitions] == [
+            {"NoncurrentDays": 30, "StorageClass": "GLACIER"}
+        ]
+        assert type(rule.noncurrent_expiration) is NoncurrentVersionExpiration
+        assert type(rule.abort_incomplete_multipart_upload) is AbortIncompleteMultipartUpload
 
     def test_from_dict_with_minimal_data(self):
         """Test from_dict with minimal data."""
@@ -182,6 +231,16 @@ class TestLifecycleRule:
         assert rule.expiration is None
         assert rule.transitions == []
 
+    def test_from_dict_prefers_aws_noncurrent_keys(self):
+        """Test from_dict keeps an explicit empty AWS noncurrent value over its alias."""
+        data = {
+            "ID": "test-rule",
+            "NoncurrentVersionTransitions": [],
+            "NoncurrentTransitions": [{"NoncurrentDays": 30, "StorageClass": "GLACIER"}],
+        }
+        rule = LifecycleRule.from_dict(data)
+        assert rule.noncurrent_transitions == []
+
     def test_from_dict_with_empty_dict(self):
         """Test from_dict with empty dict."""
         rule = LifecycleRule.from_dict({})
@@ -191,116 +250,64 @@ class TestLifecycleRule:
 
     def test_describe_with_minimal_fields(self):
         """Test describe method with minimal fields."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
+        rule = _mkrule()
         result = rule.describe()
         assert result["status"] == "Enabled"
         assert "prefix" not in result
         assert "filter" not in result
 
-    def test_describe_with_all_fields(self):
+    def test_describe_with_all_fields(self, full_rule):
         """Test describe method with all fields."""
-        rule = LifecycleRule(
-            id="test-rule",
-            prefix="logs/",
-            filter={"prefix": "data/"},
-            status="Enabled",
-            expiration={"days": 30},
-            transitions=[{"days": 30, "storageclass": "GLACIER"}],
-            noncurrent_transitions=[{"noncurrentdays": 30, "storageclass": "GLACIER"}],
-            noncurrent_expiration={"noncurrentdays": 90},
-            abort_incomplete_multipart_upload={"daysafterinitiation": 7},
-        )
-        result = rule.describe()
-        assert result["prefix"] == "logs/"
-        assert "filter" in result
-        assert result["status"] == "Enabled"
-        assert "expiration" in result
-        assert len(result["transitions"]) == 1
-        assert len(result["noncurrent_transitions"]) == 1
-        assert "noncurrent_expiration" in result
-        assert "abort_incomplete_multipart_upload" in result
+        result = full_rule.describe()
+        assert result == _EXPECTED_DESCRIBE
 
     def test_to_payload_with_minimal_fields(self):
         """Test to_payload method with minimal fields."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
+        rule = _mkrule()
         result = rule.to_payload()
         assert result["ID"] == "test-rule"
         assert result["Status"] == "Enabled"
         assert "Filter" not in result
 
-    def test_to_payload_with_all_fields(self):
+    def test_to_payload_with_all_fields(self, full_rule):
         """Test to_payload method with all fields."""
-        rule = LifecycleRule(
-            id="test-rule",
-            prefix="logs/",
-            filter={"prefix": "data/"},
-            status="Enabled",
-            expiration={"days": 30},
-            transitions=[{"days": 30, "storageclass": "GLACIER"}],
-            noncurrent_transitions=[{"noncurrentdays": 30, "storageclass": "GLACIER"}],
-            noncurrent_expiration={"noncurrentdays": 90},
-            abort_incomplete_multipart_upload={"daysafterinitiation": 7},
-        )
-        result = rule.to_payload()
-        assert result["ID"] == "test-rule"
-        assert "Prefix" in result
-        assert "Filter" in result
-        assert result["Status"] == "Enabled"
-        assert "Expiration" in result
-        assert len(result["Transitions"]) == 1
-        assert len(result["NoncurrentVersionTransitions"]) == 1
-        assert "NoncurrentVersionExpiration" in result
-        assert "AbortIncompleteMultipartUpload" in result
+        result = full_rule.to_payload()
+        assert result == _EXPECTED_PAYLOAD
+
+    def test_to_payload_json_with_all_fields(self, full_rule):
+        """Test to_payload_json emits the expected payload bytes in field order."""
+        assert full_rule.to_payload_json() == _EXPECTED_PAYLOAD_JSON
 
     def test_to_dict_with_minimal_fields(self):
         """Test to_dict method with minimal fields."""
-        rule = LifecycleRule(id="test-rule", status="Enabled")
+        rule = _mkrule()
         result = rule.to_dict()
         assert result["id"] == "test-rule"
         assert result["status"] == "Enabled"
 
-    def test_to_dict_with_all_fields(self):
+    def test_to_dict_with_all_fields(self, full_rule):
         """Test to_dict method with all fields."""
-        rule = LifecycleRule(
-            id="test-rule",
-            prefix="logs/",
-            filter={"prefix": "data/"},
-            status="Enabled",
-            expiration={"days": 30},
-            transitions=[{"days": 30, "storageclass": "GLACIER"}],
-            noncurrent_transitions=[{"noncurrentdays": 30, "storageclass": "GLACIER"}],
-            noncurrent_expiration={"noncurrentdays": 90},
-            abort_incomplete_multipart_upload={"daysafterinitiation": 7},
-        )
-        result = rule.to_dict()
-        assert result["id"] == "test-rule"
-        assert result["prefix"] == "logs/"
-        assert "filter" in result
-        assert result["status"] == "Enabled"
-        assert "expiration" in result
-        assert len(result["transitions"]) == 1
-        assert len(result["noncurrent_transitions"]) == 1
-        assert "noncurrent_expiration" in result
-        assert "abort_incomplete_multipart_upload" in result
+        result = full_rule.to_dict()
+        assert result == _EXPECTED_DICT
 
     def test_resolve_transitions_with_none(self):
-        """Test _resolve_transitions with None."""
-        rule = LifecycleRule(id="test-rule", transitions=None, status="Enabled")
+        """Test transitions resolves with None."""
+        rule = _mkrule(transitions=None)
         assert rule.transitions == []
 
     def test_resolve_noncurrent_transitions_with_none(self):
-        """Test _resolve_noncurrent_transitions with None."""
-        rule = LifecycleRule(id="test-rule", noncurrent_transitions=None, status="Enabled")
+        """Test noncurrent_transitions resolves with None."""
+        rule = _mkrule(noncurrent_transitions=None)
         assert rule.noncurrent_transitions == []
 
     def test_resolve_expiration_with_none(self):
-        """Test _resolve_expiration with None."""
-        rule = LifecycleRule(id="test-rule", expiration=None, status="Enabled")
+        """Test expiration resolves with None."""
+        rule = _mkrule(expiration=None)
         assert rule.expiration is None
 
     def test_resolve_filter_with_none(self):
-        """Test _resolve_filter with None."""
-        rule = LifecycleRule(id="test-rule", filter=None, status="Enabled")
+        """Test filter resolves with None."""
+        rule = _mkrule(filter=None)
         assert rule.filter is None
 
     def test_complex_rule_with_multiple_transitions(self):
@@ -317,7 +324,163 @@ class TestLifecycleRule:
             expiration={"days": 730},
         )
         assert len(rule.transitions) == 3
-        assert rule.transitions[0].storageclass.value == "STANDARD_IA"
-        assert rule.transitions[1].storageclass.value == "GLACIER"
-        assert rule.transitions[2].storageclass.value == "DEEP_ARCHIVE"
+        assert rule.transitions[0].storageclass is StorageClass.STANDARD_IA
+        assert rule.transitions[1].storageclass is StorageClass.GLACIER
+        assert rule.transitions[2].storageclass is StorageClass.DEEP_ARCHIVE
         assert rule.expiration.days == 730
+
+    def test_fingerprint_matches_describe_digest(self):
+        """Test cached fingerprint equals SHA256 of the serialized describe()."""
+        rule = LifecycleRule(status="Enabled", prefix="logs/", expiration={"days": 30})
+        dnaserial = json.dumps(rule.describe(), sort_keys=True, ensure_ascii=False)
+        assert rule.fingerprint == hashlib.sha256(dnaserial.encode()).hexdigest()
+        assert rule.id == rule.fingerprint
+
+    def test_fingerprint_identical_rules_share_value(self):
+        """Test identical rules resolve to the same fingerprint."""
+        rule1 = LifecycleRule(status="Enabled", transitions=[{"days": 30, "storageclass": "GLACIER"}])
+        rule2 = LifecycleRule(status="Enabled", transitions=[{"days": 30, "storageclass": "GLACIER"}])
+        rule3 = LifecycleRule(status="Enabled", transitions=[{"days": 31, "storageclass": "GLACIER"}])
+        assert rule1.fingerprint == rule2.fingerprint
+        assert rule1.fingerprint != rule3.fingerprint
+
+    def test_resolve_children_with_dict_subclass(self):
+        """Test dict subclasses resolve through the isinstance fallback."""
+        rule = _mkrule(expiration=OrderedDict(days=30), transitions=[OrderedDict(days=90, storageclass="GLACIER")])
+        assert type(rule.expiration) is Expiration
+        assert rule.expiration.days == 30
+        assert rule.transitions[0].days == 90
+
+    def test_resolve_children_skips_unsupported_types(self):
+        """Test unsupported child types are dropped."""
+        rule = _mkrule(filter="logs/", transitions=[30, None])
+        assert rule.filter is None
+        assert rule.transitions == []
+
+    def test_to_payload_json(self):
+        """Test to_payload_json serializes the to_payload structure."""
+        rule = _mkrule(expiration={"date": "2026-12-31"}, transitions=[{"days": 30, "storageclass": "GLACIER"}])
+        result = json.loads(rule.to_payload_json())
+        assert result == {
+            "ID": "test-rule",
+            "Status": "Enabled",
+            "Expiration": {"Date": "2026-12-31"},
+            "Transitions": [{"Days": 30, "StorageClass": "GLACIER"}],
+        }
+
+    def test_to_payload_json_without_orjson(self, monkeypatch):
+        """Test to_payload_json falls back to the json module with identical output."""
+        rule = LifecycleRule(
+            id="règle-archivée",
+            prefix="données/",
+            status="Enabled",
+            expiration={"date": "2026-12-31"},
+            transitions=[{"days": 30, "storageclass": "GLACIER"}],
+        )
+        expected = rule.to_payload_json()
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        result = rule.to_payload_json()
+        assert result == expected
+        assert "données/".encode() in result
+
+    def test_init_with_transitions_from_generator(self):
+        """Test transitions accept any iterable, such as a generator or a dict view."""
+        rule = _mkrule(transitions=({"days": days, "storageclass": "GLACIER"} for days in (30, 90)))
+        assert [trans.days for trans in rule.transitions] == [30, 90]
+        by_name = {"ia": Transition(days=30, storageclass="STANDARD_IA")}
+        assert _mkrule(transitions=by_name.values()).transitions == list(by_name.values())
+        assert _mkrule(transitions=iter([])).transitions == []
+
+    def test_init_with_transitions_mixed_types(self):
+        """Test transitions mixing objects and dicts keep their order."""
+        trans = Transition(days=30, storageclass="STANDARD_IA")
+        rule = _mkrule(transitions=[trans, {"days": 90, "storageclass": "GLACIER"}])
+        assert rule.transitions[0] is trans
+        assert type(rule.transitions[1]) is Transition
+        assert rule.transitions[1].days == 90
+
+    def test_rule_is_immutable_after_init(self):
+        """Test attributes of the rule and its children cannot be reassigned after construction."""
+        rule = _mkrule(expiration={"days": 30})
+        fingerprint = rule.get_fingerprint()
+        with pytest.raises(AttributeError):
+            rule.status = "Disabled"
+        with pytest.raises(AttributeError):
+            rule.expiration.days = 60
+        assert rule.status == "Enabled"
+        assert rule.get_fingerprint() == fingerprint
+
+    def test_outputs_are_fresh_dicts(self):
+        """Test mutating a returned describe/to_payload/to_dict result does not affect later calls."""
+        rule = _mkrule(expiration={"days": 30})
+        for method in (rule.describe, rule.to_payload, rule.to_dict):
+            first = method()
+            first.clear()
+            assert method() is not first
+            assert method()
+        payload = rule.to_payload()
+        payload["Expiration"]["Days"] = 60
+        assert rule.to_payload() == {"ID": "test-rule", "Status": "Enabled", "Expiration": {"Days": 30}}
+
+    def test_status_is_normalized_to_aws_casing(self):
+        """Test status values resolve to the canonical Enabled/Disabled strings."""
+        assert LifecycleRule(id="test-rule", status="enabled").status == "Enabled"
+        assert LifecycleRule(id="test-rule", status="DISABLED").status == "Disabled"
+        assert LifecycleRule(id="test-rule", status="enabled").status is LifecycleRule(status="Enabled").status
+        assert LifecycleRule(id="test-rule", status="Pending").status == "Pending"
+
+    def test_from_response(self):
+        """Test from_response builds one rule per entry of an AWS Rules list."""
+        rules = LifecycleRule.from_response(
+            [
+                {"ID": "rule-1", "Status": "Enabled", "Expiration": {"Days": 30}},
+                {"id": "rule-2", "status": "Disabled", "transitions": [{"days": 90, "storageclass": "GLACIER"}]},
+            ]
+        )
+        assert [rule.id for rule in rules] == ["rule-1", "rule-2"]
+        assert rules[0].expiration.days == 30
+        assert rules[1].transitions[0].storageclass is StorageClass.GLACIER
+        assert LifecycleRule.from_response([]) == []
+
+    def test_fingerprint_is_lazy_when_id_given(self):
+        """Test fingerprint is only computed on first access when id is supplied."""
+        rule = _mkrule()
+        assert rule._fingerprint is None
+        fingerprint = rule.fingerprint
+        assert rule._fingerprint == fingerprint
+        assert LifecycleRule(status="Enabled").fingerprint == fingerprint
+
+    def test_identical_children_are_shared(self):
+        """Test identical child dicts resolve to one pooled instance."""
+        rule1 = LifecycleRule(
+            id="rule-1", expiration={"Days": 30}, abort_incomplete_multipart_upload={"DaysAfterInitiation": 7}
+        )
+        rule2 = LifecycleRule(
+            id="rule-2", expiration={"days": 30}, abort_incomplete_multipart_upload={"DaysAfterInitiation": 7}
+        )
+        rule3 = LifecycleRule(id="rule-3", expiration={"Days": 31})
+        assert rule1.expiration is rule2.expiration
+        assert rule1.abort_incomplete_multipart_upload is rule2.abort_incomplete_multipart_upload
+        assert rule1.expiration is not rule3.expiration
+        with pytest.raises(AttributeError):
+            rule1.expiration.days = 31
+        assert rule2.expiration.days == 30
+
+    def test_pooled_builds_outside_the_lock(self):
+        """Test pooled() runs constructors without holding the pool lock, so they may pool in turn."""
+        held = []
+
+        class _PoolingExpiration(Expiration):
+            __slots__ = ()
+
+            def __init__(self, **kwargs):
+                held.append(_POOL_LOCK.locked())
+                # Would deadlock if pooled() still held its lock around this constructor
+                AbortIncompleteMultipartUpload.pooled(daysafterinitiation=7)
+                super().__init__(**kwargs)
+
+        first = _PoolingExpiration.pooled(days=45)
+        assert held == [False]
+        assert first.days == 45
+        assert _PoolingExpiration.pooled(days=45) is first
+        assert held == [False]
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
+
+import pytest
+
 from app.model.lifecycle.noncurrentversionexpiration import NoncurrentVersionExpiration
 
+_nve_fields = attrgetter("noncurrentdays", "newernoncurrentversions")
+
 
 class TestNoncurrentVersionExpiration:
     """Test NoncurrentVersionExpiration configuration class."""
@@ -11,66 +17,66 @@ class TestNoncurrentVersionExpiration:
     def test_init_with_noncurrentdays(self):
         """Test initialization with noncurrent days."""
         nve = NoncurrentVersionExpiration(noncurrentdays=30)
-        assert nve.noncurrentdays == 30
-        assert nve.newernoncurrentversions is None
+        assert _nve_fields(nve) == (30, None)
 
     def test_init_with_newernoncurrentversions(self):
         """Test initialization with newer noncurrent versions."""
         nve = NoncurrentVersionExpiration(newernoncurrentversions=5)
-        assert nve.newernoncurrentversions == 5
-        assert nve.noncurrentdays is None
+        assert _nve_fields(nve) == (None, 5)
 
     def test_init_with_both_parameters(self):
         """Test initialization with both parameters."""
         nve = NoncurrentVersionExpiration(noncurrentdays=30, newernoncurrentversions=3)
-        assert nve.noncurrentdays == 30
-        assert nve.newernoncurrentversions == 3
+        assert _nve_fields(nve) == (30, 3)
 
     def test_init_with_string_values(self):
         """Test initialization with string values."""
         nve = NoncurrentVersionExpiration(noncurrentdays="30", newernoncurrentversions="5")
-        assert nve.noncurrentdays == 30
-        assert nve.newernoncurrentversions == 5
-        assert isinstance(nve.noncurrentdays, int)
-        assert isinstance(nve.newernoncurrentversions, int)
+        assert _nve_fields(nve) == (30, 5)
+        assert type(nve.noncurrentdays) is int
+        assert type(nve.newernoncurrentversions) is int
+
+    def test_init_with_mixed_values(self):
+        """Test initialization with one int and one string value."""
+        nve = NoncurrentVersionExpiration(noncurrentdays=30, newernoncurrentversions="5")
+        assert _nve_fields(nve) == (30, 5)
+
+    def test_init_with_invalid_value_raises_error(self):
+        """Test initialization with an unsupported type raises ValueError."""
+        with pytest.raises(ValueError):
+            NoncurrentVersionExpiration(noncurrentdays=30, newernoncurrentversions=1.5)
 
     def test_init_with_no_parameters(self):
         """Test initialization with no parameters."""
         nve = NoncurrentVersionExpiration()
-        assert nve.noncurrentdays is None
-        assert nve.newernoncurrentversions is None
-
-    def test_from_dict_with_aws_format(self):
-        """Test from_dict with AWS format (PascalCase)."""
-        data = {"NoncurrentDays": 30, "NewerNoncurrentVersions": 5}
-        nve = NoncurrentVersionExpiration.from_dict(data)
-        assert nve.noncurrentdays == 30
-        assert nve.newernoncurrentversions == 5
-
-    def test_from_dict_with_lowercase_format(self):
-        """Test from_dict with lowercase format."""
-        data = {"noncurrentdays": 90, "newernoncurrentversions": 10}
+        assert _nve_fields(nve) == (None, None)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param({"NoncurrentDays": 30, "NewerNoncurrentVersions": 5}, id="aws"),
+            pytest.param({"noncurrentdays": 30, "newernoncurrentversions": 5}, id="lower"),
+        ],
+    )
+    def test_from_dict_key_casing(self, data):
+        """Test from_dict with AWS (PascalCase) and lowercase keys."""
         nve = NoncurrentVersionExpiration.from_dict(data)
-        assert nve.noncurrentdays == 90
-        assert nve.newernoncurrentversions == 10
+        assert _nve_fields(nve) == (30, 5)
 
     def test_from_dict_with_partial_data(self):
         """Test from_dict with partial data."""
         data = {"NoncurrentDays": 60}
         nve = NoncurrentVersionExpiration.from_dict(data)
-        assert nve.noncurrentdays == 60
-        assert nve.newernoncurrentversions is None
+        assert _nve_fields(nve) == (60, None)
 
     def test_from_dict_with_empty_dict(self):
         """Test from_dict with empty dict."""
         nve = NoncurrentVersionExpiration.from_dict({})
-        assert nve.noncurrentdays is None
-        assert nve.newernoncurrentversions is None
+        assert _nve_fields(nve) == (None, None)
 
-    def test_describe_with_noncurrentdays(self):
+    def test_describe_with_noncurrentdays(self, noncurrentdays_expiration):
         """Test describe method with noncurrent days."""
-        nve = NoncurrentVersionExpiration(noncurrentdays=30)
-        result = nve.describe()
+        result = noncurrentdays_expiration.describe()
         assert result == {"noncurrentdays": 30}
 
     def test_describe_with_newernoncurrentversions(self):
@@ -79,10 +85,9 @@ class TestNoncurrentVersionExpiration:
         result = nve.describe()
         assert result == {"newernoncurrentversions": 5}
 
-    def test_describe_with_both_fields(self):
+    def test_describe_with_both_fields(self, both_fields_noncurrent_expiration):
         """Test describe method with both fields."""
-        nve = NoncurrentVersionExpiration(noncurrentdays=30, newernoncurrentversions=3)
-        result = nve.describe()
+        result = both_fields_noncurrent_expiration.describe()
         assert result["noncurrentdays"] == 30
         assert result["newernoncurrentversions"] == 3
 
@@ -92,10 +97,9 @@ class TestNoncurrentVersionExpiration:
         result = nve.describe()
         assert result == {}
 
-    def test_to_payload_with_noncurrentdays(self):
+    def test_to_payload_with_noncurrentdays(self, noncurrentdays_expiration):
         """Test to_payload method with noncurrent days."""
-        nve = NoncurrentVersionExpiration(noncurrentdays=30)
-        result = nve.to_payload()
+        result = noncurrentdays_expiration.to_payload()
         assert result == {"NoncurrentDays": 30}
 
     def test_to_payload_with_newernoncurrentversions(self):
@@ -104,10 +108,9 @@ class TestNoncurrentVersionExpiration:
         result = nve.to_payload()
         assert result == {"NewerNoncurrentVersions": 5}
 
-    def test_to_payload_with_both_fields(self):
+    def test_to_payload_with_both_fields(self, both_fields_noncurrent_expiration):
         """Test to_payload method with both fields."""
-        nve = NoncurrentVersionExpiration(noncurrentdays=30, newernoncurrentversions=3)
-        result = nve.to_payload()
+        result = both_fields_noncurrent_expiration.to_payload()
         assert result["NoncurrentDays"] == 30
         assert result["NewerNoncurrentVersions"] == 3
 
@@ -117,22 +120,19 @@ class TestNoncurrentVersionExpiration:
         result = nve.to_payload()
         assert result == {}
 
-    def test_to_dict_with_noncurrentdays(self):
+    def test_to_dict_with_noncurrentdays(self, noncurrentdays_expiration):
         """Test to_dict method with noncurrent days."""
-        nve = NoncurrentVersionExpiration(noncurrentdays=30)
-        result = nve.to_dict()
+        result = noncurrentdays_expiration.to_dict()
         assert result["noncurrentdays"] == 30
         assert result["newernoncurrentversions"] is None
 
-    def test_to_dict_with_both_fields(self):
+    def test_to_dict_with_both_fields(self, both_fields_noncurrent_expiration):
         """Test to_dict method with both fields."""
-        nve = NoncurrentVersionExpiration(noncurrentdays=30, newernoncurrentversions=5)
-        result = nve.to_dict()
+        result = both_fields_noncurrent_expiration.to_dict()
         assert result["noncurrentdays"] == 30
-        assert result["newernoncurrentversions"] == 5
+        assert result["newernoncurrentversions"] == 3
 
     def test_zero_values(self):
         """Test with zero values."""
         nve = NoncurrentVersionExpiration(noncurrentdays=0, newernoncurrentversions=0)
-        assert nve.noncurrentdays == 0
-        assert nve.newernoncurrentversions == 0
+        assert _nve_fields(nve) == (0, 0)
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
+
+import pytest
+
 from app.model.lifecycle.noncurrentversiontransition import NoncurrentVersionTransition
 from app.model.lifecycle.storageclass import StorageClass
 
+_STORAGE_CLASSES = ("GLACIER", "STANDARD_IA", "ONEZONE_IA", "INTELLIGENT_TIERING", "DEEP_ARCHIVE", "GLACIER_IR")
+
+_nvt_fields = attrgetter("noncurrentdays", "newernoncurrentversions", "storageclass")
+
 
 class TestNoncurrentVersionTransition:
     """Test NoncurrentVersionTransition configuration class."""
@@ -12,72 +20,57 @@ class TestNoncurrentVersionTransition:
     def test_init_with_noncurrentdays_and_storageclass(self):
         """Test initialization with noncurrent days and storage class."""
         nvt = NoncurrentVersionTransition(noncurrentdays=30, storageclass="GLACIER")
-        assert nvt.noncurrentdays == 30
-        assert nvt.storageclass == StorageClass.GLACIER
-        assert nvt.newernoncurrentversions is None
+        assert _nvt_fields(nvt) == (30, None, StorageClass.GLACIER)
 
     def test_init_with_all_parameters(self):
         """Test initialization with all parameters."""
         nvt = NoncurrentVersionTransition(noncurrentdays=30, newernoncurrentversions=5, storageclass="STANDARD_IA")
-        assert nvt.noncurrentdays == 30
-        assert nvt.newernoncurrentversions == 5
-        assert nvt.storageclass == StorageClass.STANDARD_IA
+        assert _nvt_fields(nvt) == (30, 5, StorageClass.STANDARD_IA)
 
     def test_init_with_string_values(self):
         """Test initialization with string values."""
         nvt = NoncurrentVersionTransition(noncurrentdays="30", newernoncurrentversions="5", storageclass="GLACIER")
         assert nvt.noncurrentdays == 30
         assert nvt.newernoncurrentversions == 5
-        assert isinstance(nvt.noncurrentdays, int)
-        assert isinstance(nvt.newernoncurrentversions, int)
+        assert type(nvt.noncurrentdays) is int
+        assert type(nvt.newernoncurrentversions) is int
 
     def test_init_with_storageclass_enum(self):
         """Test initialization with StorageClass enum."""
         nvt = NoncurrentVersionTransition(noncurrentdays=30, storageclass=StorageClass.DEEP_ARCHIVE)
-        assert nvt.storageclass == StorageClass.DEEP_ARCHIVE
+        assert nvt.storageclass is StorageClass.DEEP_ARCHIVE
 
     def test_init_with_no_parameters(self):
         """Test initialization with no parameters."""
         nvt = NoncurrentVersionTransition()
-        assert nvt.noncurrentdays is None
-        assert nvt.newernoncurrentversions is None
-        assert nvt.storageclass is None
-
-    def test_from_dict_with_aws_format(self):
-        """Test from_dict with AWS format (PascalCase)."""
-        data = {"NoncurrentDays": 30, "NewerNoncurrentVersions": 5, "StorageClass": "GLACIER"}
-        nvt = NoncurrentVersionTransition.from_dict(data)
-        assert nvt.noncurrentdays == 30
-        assert nvt.newernoncurrentversions == 5
-        assert nvt.storageclass == StorageClass.GLACIER
-
-    def test_from_dict_with_lowercase_format(self):
-        """Test from_dict with lowercase format."""
-        data = {"noncurrentdays": 90, "newernoncurrentversions": 10, "storageclass": "STANDARD_IA"}
+        assert _nvt_fields(nvt) == (None, None, None)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param({"NoncurrentDays": 30, "NewerNoncurrentVersions": 5, "StorageClass": "GLACIER"}, id="aws"),
+            pytest.param({"noncurrentdays": 30, "newernoncurrentversions": 5, "storageclass": "GLACIER"}, id="lower"),
+        ],
+    )
+    def test_from_dict_key_casing(self, data):
+        """Test from_dict with AWS (PascalCase) and lowercase keys."""
         nvt = NoncurrentVersionTransition.from_dict(data)
-        assert nvt.noncurrentdays == 90
-        assert nvt.newernoncurrentversions == 10
-        assert nvt.storageclass == StorageClass.STANDARD_IA
+        assert _nvt_fields(nvt) == (30, 5, StorageClass.GLACIER)
 
     def test_from_dict_with_partial_data(self):
         """Test from_dict with partial data."""
         data = {"NoncurrentDays": 60, "StorageClass": "GLACIER_IR"}
         nvt = NoncurrentVersionTransition.from_dict(data)
-        assert nvt.noncurrentdays == 60
-        assert nvt.storageclass == StorageClass.GLACIER_IR
-        assert nvt.newernoncurrentversions is None
+        assert _nvt_fields(nvt) == (60, None, StorageClass.GLACIER_IR)
 
     def test_from_dict_with_empty_dict(self):
         """Test from_dict with empty dict."""
         nvt = NoncurrentVersionTransition.from_dict({})
-        assert nvt.noncurrentdays is None
-        assert nvt.newernoncurrentversions is None
-        assert nvt.storageclass is None
+        assert _nvt_fields(nvt) == (None, None, None)
 
-    def test_describe_with_noncurrentdays(self):
+    def test_describe_with_noncurrentdays(self, glacier_noncurrent_transition):
         """Test describe method with noncurrent days."""
-        nvt = NoncurrentVersionTransition(noncurrentdays=30, storageclass="GLACIER")
-        result = nvt.describe()
+        result = glacier_noncurrent_transition.describe()
         assert result["noncurrentdays"] == 30
         assert result["storageclass"] == "GLACIER"
         assert "newernoncurrentversions" not in result
@@ -96,22 +89,18 @@ class TestNoncurrentVersionTransition:
         result = nvt.describe()
         assert result == {"noncurrentdays": 30}
 
-    def test_to_payload_with_noncurrentdays(self):
+    def test_to_payload_with_noncurrentdays(self, glacier_noncurrent_transition):
         """Test to_payload method with noncurrent days."""
-        nvt = NoncurrentVersionTransition(noncurrentdays=30, storageclass="GLACIER")
-        result = nvt.to_payload()
+        result = glacier_noncurrent_transition.to_payload()
         assert result["NoncurrentDays"] == 30
         assert result["StorageClass"] == "GLACIER"
 
-    def test_to_payload_with_all_fields(self):
+    def test_to_payload_with_all_fields(self, all_fields_noncurrent_transition):
         """Test to_payload method with all fields."""
-        nvt = NoncurrentVersionTransition(
-            noncurrentdays=30, newernoncurrentversions=5, storageclass="INTELLIGENT_TIERING"
-        )
-        result = nvt.to_payload()
+        result = all_fields_noncurrent_transition.to_payload()
         assert result["NoncurrentDays"] == 30
         assert result["NewerNoncurrentVersions"] == 5
-        assert result["StorageClass"] == "INTELLIGENT_TIERING"
+        assert result["StorageClass"] == "DEEP_ARCHIVE"
 
     def test_to_payload_with_no_fields(self):
         """Test to_payload method with no fields set."""
@@ -119,25 +108,22 @@ class TestNoncurrentVersionTransition:
         result = nvt.to_payload()
         assert result == {}
 
-    def test_to_dict_with_noncurrentdays(self):
+    def test_to_dict_with_noncurrentdays(self, glacier_noncurrent_transition):
         """Test to_dict method with noncurrent days."""
-        nvt = NoncurrentVersionTransition(noncurrentdays=30, storageclass="GLACIER")
-        result = nvt.to_dict()
+        result = glacier_noncurrent_transition.to_dict()
         assert result["noncurrentdays"] == 30
         assert result["storageclass"] == "GLACIER"
         assert result["newernoncurrentversions"] is None
 
-    def test_to_dict_with_all_fields(self):
+    def test_to_dict_with_all_fields(self, all_fields_noncurrent_transition):
         """Test to_dict method with all fields."""
-        nvt = NoncurrentVersionTransition(noncurrentdays=30, newernoncurrentversions=5, storageclass="DEEP_ARCHIVE")
-        result = nvt.to_dict()
+        result = all_fields_noncurrent_transition.to_dict()
         assert result["noncurrentdays"] == 30
         assert result["newernoncurrentversions"] == 5
         assert result["storageclass"] == "DEEP_ARCHIVE"
 
-    def test_all_storage_classes(self):
+    @pytest.mark.parametrize("sc", _STORAGE_CLASSES)
+    def test_all_storage_classes(self, sc):
         """Test with all valid storage classes."""
-        storage_classes = ["GLACIER", "STANDARD_IA", "ONEZONE_IA", "INTELLIGENT_TIERING", "DEEP_ARCHIVE", "GLACIER_IR"]
-        for sc in storage_classes:
-            nvt = NoncurrentVersionTransition(noncurrentdays=30, storageclass=sc)
-            assert nvt.storageclass.value == sc
+        nvt = NoncurrentVersionTransition(noncurrentdays=30, storageclass=sc)
+        assert nvt.storageclass is StorageClass(sc)
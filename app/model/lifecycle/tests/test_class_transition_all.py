@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
+
+import pytest
 
 from app.model.lifecycle.storageclass import StorageClass
 from app.model.lifecycle.transition import Transition
@@ -18,6 +20,13 @@ class TestTransition:
         assert trans.storageclass == StorageClass.GLACIER
         assert trans.date is None
 
+    def test_instances_use_slots(self):
+        """Test Transition instances carry no per-instance __dict__."""
+        trans = Transition(days=30, storageclass="GLACIER")
+        assert not hasattr(trans, "__dict__")
+        with pytest.raises(AttributeError):
+            trans.unknown = 1
+
     def test_init_with_date_and_storageclass(self):
         """Test initialization with date and storage class."""
         test_date = date(2026, 12, 31)
@@ -26,6 +35,13 @@ class TestTransition:
         assert trans.storageclass == StorageClass.STANDARD_IA
         assert trans.days is None
 
+    def test_datetime_input_formats_as_date(self):
+        """Test a datetime input describes and serializes as YYYY-MM-DD without the time."""
+        trans = Transition(date=datetime(2026, 12, 31, 5, 6), storageclass="GLACIER")
+        assert trans.describe()["date"] == "2026-12-31"
+        assert trans.to_dict()["date"] == "2026-12-31"
+        assert trans.get_fingerprint() == Transition(date="2026-12-31", storageclass="GLACIER").get_fingerprint()
+
     def test_init_with_date_string(self):
         """Test initialization with date string."""
         trans = Transition(date="2026-12-31", storageclass="DEEP_ARCHIVE")
@@ -35,7 +51,7 @@ class TestTransition:
     def test_init_with_storageclass_enum(self):
         """Test initialization with StorageClass enum."""
         trans = Transition(days=90, storageclass=StorageClass.GLACIER_IR)
-        assert trans.storageclass == StorageClass.GLACIER_IR
+        assert trans.storageclass is StorageClass.GLACIER_IR
 
     def test_init_with_days_as_string(self):
         """Test initialization with days as string."""
@@ -43,6 +59,11 @@ class TestTransition:
         assert trans.days == 30
         assert isinstance(trans.days, int)
 
+    def test_init_with_invalid_days_raises(self):
+        """Test initialization with a non-int, non-string days value raises ValueError."""
+        with pytest.raises(ValueError):
+            Transition(days=1.5, storageclass="GLACIER")
+
     def test_init_with_no_parameters(self):
         """Test initialization with no parameters."""
         trans = Transition()
@@ -74,6 +95,12 @@ class TestTransition:
         assert trans.storageclass == StorageClass.DEEP_ARCHIVE
         assert trans.date is None
 
+    def test_from_dict_keeps_zero_days(self):
+        """Test from_dict keeps a falsy Days value instead of dropping it."""
+        trans = Transition.from_dict({"Days": 0, "StorageClass": "GLACIER"})
+        assert trans.days == 0
+        assert trans.to_payload() == {"Days": 0, "StorageClass": "GLACIER"}
+
     def test_from_dict_with_empty_dict(self):
         """Test from_dict with empty dict."""
         trans = Transition.from_dict({})
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Any, Union
+from typing import Any
 
 from app.model.lifecycle.common import S3Configuration
 from app.model.lifecycle.storageclass import StorageClass
@@ -38,15 +38,18 @@ class Transition(S3Configuration):
     ```
     """
 
+    __slots__ = ("date", "days", "storageclass", "_date_str", "_frozen")
+
     @classmethod
     def from_dict(
         cls,
         data: dict[str, Any],
     ) -> Transition:
-        return cls(
-            date=data.get("Date") or data.get("date"),
-            days=data.get("Days") or data.get("days"),
-            storageclass=data.get("StorageClass") or data.get("storageclass"),
+        data = cls.casefold_keys(data)
+        return cls.pooled(
+            date=data.get("date"),
+            days=data.get("days"),
+            storageclass=data.get("storageclass"),
         )
 
     def __init__(
@@ -55,21 +58,28 @@ class Transition(S3Configuration):
         days: int | str | None = None,
         storageclass: StorageClass | str | None = None,
     ) -> None:
-        self.date: date | None = self.resolve_date(date)
-        self.days: int | None = self.resolve_days(days)
-        self.storageclass: StorageClass | None = self.resolve_storageclass(storageclass)
+        # Fast path: None, int days and StorageClass members are stored without a resolve_* call
+        self.date: date | None = None if date is None else self.resolve_date(date)
+        # Formatted once; describe() and to_dict() reuse it
+        self._date_str: str | None = self.date.strftime("%Y-%m-%d") if self.date else None
+        self.days: int | None = days if days is None or days.__class__ is int else self.resolve_days(days)
+        if storageclass is None or storageclass.__class__ is StorageClass:
+            self.storageclass: StorageClass | None = storageclass
+        else:
+            self.storageclass = self.resolve_storageclass(storageclass)
+        self._frozen = True
 
-    def describe(self) -> dict[str, Union[str, int]]:
+    def describe(self) -> dict[str, str | int]:
         result = {}
-        if self.date:
-            result["date"] = self.date.strftime("%Y-%m-%d")
+        if self._date_str:
+            result["date"] = self._date_str
         if self.days is not None:
             result["days"] = self.days
         if self.storageclass:
             result["storageclass"] = self.storageclass.value
         return result
 
-    def to_payload(self) -> dict[str, Union[date, str, int]]:
+    def to_payload(self) -> dict[str, date | str | int]:
         result = {}
         if self.date:
             result["Date"] = self.date
@@ -81,7 +91,7 @@ class Transition(S3Configuration):
 
     def to_dict(self) -> dict[str, Any]:
         result = {
-            "date": self.date.strftime("%Y-%m-%d") if self.date else None,
+            "date": self._date_str,
             "days": self.days,
             "storageclass": self.storageclass.value if self.storageclass else None,
         }
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from app.model.resource.bucket import Bucket
 from app.model.resource.common import S3Component
 
+# Loading buckets issues one lifecycle request per bucket; cap concurrent requests
+_MAX_BUCKET_WORKERS = 32
+
 
 class Account(S3Component):
     """
@@ -14,7 +18,8 @@ class Account(S3Component):
     - Provides runtime access to AWS S3 buckets via boto3
 
     Methods:
-    - list_buckets(): Retrieve list of Bucket objects in account region
+    - load(prefetch): Populate buckets from list_buckets()
+    - list_buckets(prefetch): Retrieve list of Bucket objects in account region, optionally prefetching lifecycles
     - describe(): Return account info with bucket count and names
     - to_dict(): Serialize account and buckets to dict
 
@@ -53,12 +58,17 @@ class Account(S3Component):
         )
         self.buckets: dict[str, Bucket] = {}
 
-    def load(self) -> None:
-        for bucket in self.list_buckets():
+    def load(
+        self,
+        prefetch: bool = False,
+    ) -> None:
+        for bucket in self.list_buckets(prefetch=prefetch):
             self.buckets[bucket.name] = bucket
 
-    def list_buckets(self) -> list[Bucket]:
-        buckets = []
+    def list_buckets(
+        self,
+        prefetch: bool = False,
+    ) -> list[Bucket]:
         try:
             response = self.client.list_buckets()
         except Exception as e:
@@ -66,31 +76,40 @@ class Account(S3Component):
             self.error(msg)
             raise RuntimeError(msg) from e
 
-        for bucketmeta in response.get("Buckets", []):
-            bucketname = bucketmeta.get("Name", None)
-            if bucketname:
-                bucket = Bucket(
-                    name=bucketname,
-                    account=self.account,
-                    region=self.region,
-                    client=self.client,
-                    parent=self,
-                )
-                buckets.append(bucket)
+        bucketnames = [bucketmeta.get("Name") for bucketmeta in response.get("Buckets", [])]
+        buckets = [self._make_bucket(bucketname) for bucketname in bucketnames if bucketname]
+        if prefetch and buckets:
+            # Callers that read every lifecycle configuration fetch them concurrently up front;
+            # otherwise each Bucket fetches its own on first access
+            with ThreadPoolExecutor(max_workers=min(_MAX_BUCKET_WORKERS, len(buckets))) as executor:
+                list(executor.map(Bucket.load, buckets))
         return buckets
 
+    def _make_bucket(
+        self,
+        bucketname: str,
+    ) -> Bucket:
+        return Bucket(
+            name=bucketname,
+            account=self.account,
+            region=self.region,
+            client=self.client,
+            parent=self,
+        )
+
     def list_bucketnames(self) -> list[str]:
-        return [bucket.name for bucket in self.buckets.values()]
+        # Buckets are keyed by name, so the keys already are the names
+        return list(self.buckets)
 
     def describe(self) -> dict[str, Any]:
         result = super().describe()
         result["buckets_count"] = len(self.buckets)
-        result["bucket_names"] = [bucket.name for bucket in self.buckets.values()]
+        result["bucket_names"] = self.list_bucketnames()
         return result
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "account": self.account,
             "region": self.region,
-            "buckets": [bucket.describe() for bucket in self.buckets.values()],
+            "buckets": list(map(Bucket.describe, self.buckets.values())),
         }
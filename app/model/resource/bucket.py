@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import traceback
 from typing import Any
 
 from botocore.exceptions import ClientError
@@ -22,7 +21,9 @@ class Bucket(S3Component):
     - get_lifecycle_configuration(): Retrieve lifecycle config from S3
     - put_lifecycle_configuration(config): Update lifecycle config in S3
     - add_rule(rule): Add a lifecycle rule to the bucket
-    - delete_rule(rule): Remove a lifecycle rule from the bucket
+    - add_rules(rules): Add several lifecycle rules with a single put
+    - remove_rule(rule): Remove a lifecycle rule from the bucket
+    - remove_rules(rules): Remove several lifecycle rules with a single put
     - describe(): Return bucket info with lifecycle configuration
     - to_dict(): Serialize bucket to dict format
 
@@ -31,7 +32,7 @@ class Bucket(S3Component):
     - account: AWS account ID (inherited)
     - region: AWS region name (inherited)
     - client: boto3 S3 client (inherited)
-    - lifecycle_configuration: LifecycleConfiguration object or None
+    - lifecycle_configuration: LifecycleConfiguration object, fetched on first access
 
     Example:
     ```python
@@ -66,11 +67,24 @@ class Bucket(S3Component):
             parent=parent,
         )
         self.name: str = name
-        self.lifecycle_configuration: LifecycleConfiguration | None = None
-        self.load()
+        self._lifecycle_configuration: LifecycleConfiguration | None = None
+
+    @property
+    def lifecycle_configuration(self) -> LifecycleConfiguration:
+        # Fetched on first access so constructing a Bucket issues no request
+        if self._lifecycle_configuration is None:
+            self.load()
+        return self._lifecycle_configuration
+
+    @lifecycle_configuration.setter
+    def lifecycle_configuration(
+        self,
+        lifecycle_configuration: LifecycleConfiguration | None,
+    ) -> None:
+        self._lifecycle_configuration = lifecycle_configuration
 
     def load(self) -> None:
-        self.lifecycle_configuration = self.get_lifecycle_configuration()
+        self._lifecycle_configuration = self.get_lifecycle_configuration()
 
     def get_lifecycle_configuration(self) -> LifecycleConfiguration:
         try:
@@ -115,60 +129,75 @@ class Bucket(S3Component):
                 Bucket=self.name,
                 LifecycleConfiguration=lifecycle_config_param,
             )
-        except Exception:
-            error_trackback = traceback.format_exc()
+        except Exception as e:
+            # The chained exception keeps the traceback for whoever handles it
             msg = f"Failed to put lifecycle configuration for '{self.name}'"
             self.error(
                 msg,
-                context={"traceback": error_trackback.splitlines()},
+                context={"exception": repr(e)},
             )
-            raise RuntimeError(msg)
+            raise RuntimeError(msg) from e
+
+    def _resolve_rules(
+        self,
+        rules: list[LifecycleRule | dict],
+    ) -> list[LifecycleRule]:
+        resolved = []
+        for rule in rules:
+            if isinstance(rule, dict):
+                rule = LifecycleRule.from_dict(rule)
+            if not isinstance(rule, LifecycleRule):
+                msg = "rule must be an instance of LifecycleRule or dict"
+                raise ValueError(msg)
+            resolved.append(rule)
+        return resolved
+
+    def remove_rules(
+        self,
+        rules: list[LifecycleRule | dict],
+    ) -> None:
+        # Validate every rule before touching the configuration, then put once
+        rules = self._resolve_rules(rules)
+        # The property loads on first access and load() always yields a configuration
+        lifecycle_configuration = self.lifecycle_configuration
+        for rule in rules:
+            lifecycle_configuration.remove_rule(rule, strict=False)
+        self.put_lifecycle_configuration(lifecycle_configuration)
+
+    def add_rules(
+        self,
+        rules: list[LifecycleRule | dict],
+    ) -> None:
+        # Validate every rule before touching the configuration, then put once
+        rules = self._resolve_rules(rules)
+        # The property loads on first access and load() always yields a configuration
+        lifecycle_configuration = self.lifecycle_configuration
+        for rule in rules:
+            lifecycle_configuration.add_rule(rule, strict=False)
+        self.put_lifecycle_configuration(lifecycle_configuration)
 
     def remove_rule(
         self,
         rule: LifecycleRule | dict,
     ) -> None:
-        if isinstance(rule, dict):
-            rule = LifecycleRule.from_dict(rule)
-        if not isinstance(rule, LifecycleRule):
-            msg = "rule must be an instance of LifecycleRule or dict"
-            raise ValueError(msg)
-        if not self.lifecycle_configuration:
-            self.load()
-        if self.lifecycle_configuration:
-            self.lifecycle_configuration.remove_rule(rule, strict=False)
-            self.put_lifecycle_configuration(self.lifecycle_configuration)
+        self.remove_rules([rule])
 
     def add_rule(
         self,
         rule: LifecycleRule | dict,
     ) -> None:
-        if isinstance(rule, dict):
-            rule = LifecycleRule.from_dict(rule)
-        if not isinstance(rule, LifecycleRule):
-            msg = "rule must be an instance of LifecycleRule or dict"
-            raise ValueError(msg)
-        if not self.lifecycle_configuration:
-            self.load()
-        if self.lifecycle_configuration:
-            self.lifecycle_configuration.add_rule(rule, strict=False)
-            self.put_lifecycle_configuration(self.lifecycle_configuration)
+        self.add_rules([rule])
 
     def describe(self) -> dict[str, Any]:
         result = super().describe()
         result["name"] = self.name
-        if self.lifecycle_configuration:
-            result["lifecycle_configuration"] = self.lifecycle_configuration.describe()
+        result["lifecycle_configuration"] = self.lifecycle_configuration.describe()
         return result
 
     def to_dict(self) -> dict[str, Any]:
-        if self.lifecycle_configuration:
-            lcc = self.lifecycle_configuration.to_dict()
-        else:
-            lcc = None
         return {
             "name": self.name,
             "account": self.account,
             "region": self.region,
-            "lifecycle_configuration": lcc,
+            "lifecycle_configuration": self.lifecycle_configuration.to_dict(),
         }
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-
-import boto3
+from functools import lru_cache
 
 from app.base.component import Component
 
 
+@lru_cache(maxsize=None)
+def _get_default_client(region: str | None):
+    # Client construction loads service models and endpoint data, so share one
+    # per region; boto3 clients are thread-safe. boto3 itself is imported here
+    # because it dominates import time and is only needed for this fallback.
+    # Clients are cached for the life of the process (including any credentials
+    # or mocks active when first built); _get_default_client.cache_clear() resets
+    import boto3
+
+    return boto3.client("s3", region_name=region)
+
+
 class S3Component(Component):
     """
     Description:
     - Base class for AWS S3 runtime components (Account, Bucket)
     - Extends Component with S3-specific attributes (account, region, client)
     - Supports parent-child hierarchy for configuration inheritance
-    - Automatically resolves boto3 client if not provided
+    - Automatically resolves boto3 client if not provided (shared per region for the process lifetime)
 
     Methods:
     - resolve_date(value): Convert value to date object
@@ -57,14 +68,14 @@ class S3Component(Component):
     ):
         if account:
             return account
-        if self.parent:
-            if hasattr(self.parent, "account"):
-                return getattr(self.parent, "account")
-        if not account or not isinstance(account, str):
-            msg = f"Provided account invalid: {account}"
-            self.error(msg)
-            raise ValueError(msg)
-        return account
+        # EAFP: one attribute lookup; a missing parent (None) raises AttributeError too
+        try:
+            return self.parent.account
+        except AttributeError:
+            pass
+        msg = f"Provided account invalid: {account}"
+        self.error(msg)
+        raise ValueError(msg)
 
     def _resolve_region(
         self,
@@ -72,26 +83,24 @@ class S3Component(Component):
     ):
         if region:
             return region
-        if self.parent:
-            if hasattr(self.parent, "region"):
-                return getattr(self.parent, "region")
-        if not region or not isinstance(region, str):
-            msg = f"Provided region invalid: {region}"
-            self.error(msg)
-            raise ValueError(msg)
-        return region
+        try:
+            return self.parent.region
+        except AttributeError:
+            pass
+        msg = f"Provided region invalid: {region}"
+        self.error(msg)
+        raise ValueError(msg)
 
     def _resolve_client(
         self,
         client: object | None = None,
     ):
-        if client and isinstance(client, object):
+        if client:
             return client
-        if self.parent:
-            if hasattr(self.parent, "client"):
-                return getattr(self.parent, "client")
-        client = boto3.client("s3")
-        return client
+        try:
+            return self.parent.client
+        except AttributeError:
+            return _get_default_client(self.region)
 
     def resolve_date(
         self,
@@ -104,7 +113,9 @@ class S3Component(Component):
         if isinstance(value, date):
             return value
         if isinstance(value, str):
-            resolved = datetime.strptime(value, "%Y-%m-%d").date()  # YYYY-MM-DD
+            if len(value) == 10 and value[4] == "-" and value[7] == "-":
+                return date.fromisoformat(value)  # YYYY-MM-DD, parsed in C
+            resolved = datetime.strptime(value, "%Y-%m-%d").date()
             return resolved
         else:
             msg = f"Invalid date value: {value!r}."
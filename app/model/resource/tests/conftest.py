@@ -0,0 +1,22 @@
+"""Shared fixtures for resource tests."""
+
+from __future__ import annotations
+
+import pytest
+from moto import mock_aws
+
+from app.model.resource.account import Account
+
+
+@pytest.fixture(scope="module")
+def loaded_account(s3_clients, bucket_configurations) -> Account:
+    """Account loaded with two us-west-2 buckets; read-only, no mock needed after setup."""
+    # Prefetch every bucket's lifecycle configuration inside the mock, so describe()
+    # and to_dict() issue no further requests once the mock below has exited
+    client = s3_clients["us-west-2"]
+    with mock_aws():
+        for bucketname in ("bucket-a", "bucket-b"):
+            client.create_bucket(Bucket=bucketname, CreateBucketConfiguration=bucket_configurations["us-west-2"])
+        account = Account(account="123456789012", region="us-west-2", client=client)
+        account.load(prefetch=True)
+    return account
@@ -2,46 +2,45 @@
 
 from __future__ import annotations
 
-import boto3
+from unittest.mock import MagicMock
+
+import pytest
 from moto import mock_aws
 
 from app.model.resource.account import Account
 from app.model.resource.bucket import Bucket
 
+CASES = [
+    pytest.param("123456789012", "us-west-2", True, id="all-parameters"),
+    pytest.param("123456789012", "us-east-1", False, id="minimal-parameters"),
+    pytest.param("222222222222", "us-west-2", False, id="default-client"),
+]
+
 
 class TestAccount:
     """Test Account configuration class."""
 
     @mock_aws
-    def test_init_with_all_parameters(self):
-        """Test initialization with all parameters."""
-        client = boto3.client("s3", region_name="us-west-2")
+    @pytest.mark.parametrize("account_id,region,with_client", CASES)
+    def test_init(self, s3_clients, account_id, region, with_client):
+        """Test initialization with and without an explicit client."""
+        client = s3_clients[region] if with_client else None
         account = Account(
-            account="123456789012",
-            region="us-west-2",
+            account=account_id,
+            region=region,
             client=client,
         )
-        assert account.account == "123456789012"
-        assert account.region == "us-west-2"
-        assert account.client == client
-        assert isinstance(account.buckets, dict)
-        assert len(account.buckets) == 0
-
-    @mock_aws
-    def test_init_with_minimal_parameters(self):
-        """Test initialization with minimal parameters."""
-        account = Account(
-            account="123456789012",
-            region="us-east-1",
-        )
-        assert account.account == "123456789012"
-        assert account.region == "us-east-1"
-        assert isinstance(account.buckets, dict)
+        assert (account.account, account.region) == (account_id, region)
+        if with_client:
+            assert account.client is client
+        else:
+            assert account.client is not None
+        assert account.buckets == {}
 
     @mock_aws
-    def test_list_buckets_empty(self):
+    def test_list_buckets_empty(self, s3_clients):
         """Test list_buckets with no buckets."""
-        client = boto3.client("s3", region_name="us-west-2")
+        client = s3_clients["us-west-2"]
         account = Account(
             account="123456789012",
             region="us-west-2",
@@ -52,11 +51,11 @@ class TestAccount:
         assert len(buckets) == 0
 
     @mock_aws
-    def test_list_buckets_with_buckets(self):
+    def test_list_buckets_with_buckets(self, s3_clients, bucket_configurations):
         """Test list_buckets with existing buckets."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="bucket-1", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
-        client.create_bucket(Bucket="bucket-2", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="bucket-1", CreateBucketConfiguration=bucket_configurations["us-west-2"])
+        client.create_bucket(Bucket="bucket-2", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account = Account(
             account="123456789012",
@@ -65,69 +64,70 @@ class TestAccount:
         )
         buckets = account.list_buckets()
         assert isinstance(buckets, list)
-        assert len(buckets) == 2
-        bucket_names = [b.name for b in buckets]
-        assert "bucket-1" in bucket_names
-        assert "bucket-2" in bucket_names
+        # Sorted rather than a set so that a duplicated bucket would still fail
+        assert sorted(b.name for b in buckets) == ["bucket-1", "bucket-2"]
 
     @mock_aws
-    def test_list_buckets_returns_bucket_objects(self):
-        """Test that list_buckets returns Bucket objects."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+    def test_list_buckets_keeps_listing_order(self, s3_clients, bucket_configurations):
+        """Test list_buckets returns buckets in list_buckets response order."""
+        client = s3_clients["us-west-2"]
+        for i in range(8):
+            client.create_bucket(Bucket=f"bucket-{i}", CreateBucketConfiguration=bucket_configurations["us-west-2"])
+        client.put_bucket_lifecycle_configuration(
+            Bucket="bucket-3",
+            LifecycleConfiguration={
+                "Rules": [{"ID": "expire", "Status": "Enabled", "Filter": {}, "Expiration": {"Days": 30}}]
+            },
+        )
 
         account = Account(
             account="123456789012",
             region="us-west-2",
             client=client,
         )
-        buckets = account.list_buckets()
-        assert all(isinstance(b, Bucket) for b in buckets)
+        buckets = account.list_buckets(prefetch=True)
+        expected = [meta["Name"] for meta in client.list_buckets()["Buckets"]]
+        assert [b.name for b in buckets] == expected
+        assert all(b._lifecycle_configuration is not None for b in buckets)
+        rules = buckets[expected.index("bucket-3")].lifecycle_configuration.rules
+        assert [rule.id for rule in rules.values()] == ["expire"]
 
     @mock_aws
-    def test_load_populates_buckets_dict(self):
-        """Test that load() populates the buckets dictionary."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="bucket-1", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
-        client.create_bucket(Bucket="bucket-2", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+    def test_list_buckets_does_not_prefetch_by_default(self, s3_clients, bucket_configurations):
+        """Test list_buckets leaves lifecycle configurations to load on first access."""
+        client = s3_clients["us-west-2"]
+        for bucketname in ("bucket-1", "bucket-2"):
+            client.create_bucket(Bucket=bucketname, CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account = Account(
             account="123456789012",
             region="us-west-2",
             client=client,
         )
-        account.load()
-
-        assert len(account.buckets) == 2
-        assert "bucket-1" in account.buckets
-        assert "bucket-2" in account.buckets
-        assert isinstance(account.buckets["bucket-1"], Bucket)
+        buckets = account.list_buckets()
+        assert [b._lifecycle_configuration for b in buckets] == [None, None]
+        assert buckets[0].lifecycle_configuration.rules == {}
 
     @mock_aws
-    def test_list_bucketnames(self):
-        """Test list_bucketnames returns list of bucket names."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="bucket-a", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
-        client.create_bucket(Bucket="bucket-b", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+    def test_list_buckets_returns_bucket_objects(self, s3_clients, bucket_configurations):
+        """Test that list_buckets returns Bucket objects."""
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account = Account(
             account="123456789012",
             region="us-west-2",
             client=client,
         )
-        account.load()
-
-        bucket_names = account.list_bucketnames()
-        assert isinstance(bucket_names, list)
-        assert len(bucket_names) == 2
-        assert "bucket-a" in bucket_names
-        assert "bucket-b" in bucket_names
+        buckets = account.list_buckets()
+        assert all(isinstance(b, Bucket) for b in buckets)
 
     @mock_aws
-    def test_describe_returns_dict(self):
-        """Test that describe returns a dictionary."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+    def test_load_populates_buckets_dict(self, s3_clients, bucket_configurations):
+        """Test that load() populates the buckets dictionary."""
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="bucket-1", CreateBucketConfiguration=bucket_configurations["us-west-2"])
+        client.create_bucket(Bucket="bucket-2", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account = Account(
             account="123456789012",
@@ -136,68 +136,44 @@ class TestAccount:
         )
         account.load()
 
-        result = account.describe()
+        assert account.buckets.keys() == {"bucket-1", "bucket-2"}
+        assert isinstance(account.buckets["bucket-1"], Bucket)
+
+    def test_list_bucketnames(self, loaded_account):
+        """Test list_bucketnames returns list of bucket names."""
+        bucket_names = loaded_account.list_bucketnames()
+        assert isinstance(bucket_names, list)
+        assert sorted(bucket_names) == ["bucket-a", "bucket-b"]
+
+    def test_describe_returns_dict(self, loaded_account):
+        """Test that describe returns a dictionary."""
+        result = loaded_account.describe()
         assert isinstance(result, dict)
-        assert "account" in result
-        assert "region" in result
-        assert "buckets_count" in result
-        assert "bucket_names" in result
         assert result["account"] == "123456789012"
         assert result["region"] == "us-west-2"
-        assert result["buckets_count"] == 1
-        assert "test-bucket" in result["bucket_names"]
+        assert result["buckets_count"] == 2
+        assert sorted(result["bucket_names"]) == ["bucket-a", "bucket-b"]
 
-    @mock_aws
-    def test_to_dict_returns_serializable_dict(self):
+    def test_to_dict_returns_serializable_dict(self, loaded_account):
         """Test that to_dict returns a serializable dictionary."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
-
-        account = Account(
-            account="123456789012",
-            region="us-west-2",
-            client=client,
-        )
-        account.load()
-
-        result = account.to_dict()
+        result = loaded_account.to_dict()
         assert isinstance(result, dict)
-        assert "account" in result
-        assert "region" in result
-        assert "buckets" in result
         assert result["account"] == "123456789012"
         assert result["region"] == "us-west-2"
         assert isinstance(result["buckets"], list)
-        assert len(result["buckets"]) == 1
+        assert len(result["buckets"]) == 2
 
-    @mock_aws
-    def test_account_inherits_from_s3component(self):
+    def test_account_inherits_from_s3component(self, loaded_account):
         """Test that Account inherits from S3Component."""
-        client = boto3.client("s3", region_name="us-west-2")
-        account = Account(
-            account="123456789012",
-            region="us-west-2",
-            client=client,
-        )
-        assert hasattr(account, "describe")
-        assert hasattr(account, "to_dict")
-        assert hasattr(account, "resolve_date")
-
-    @mock_aws
-    def test_empty_buckets_dict_on_init(self):
-        """Test that buckets dict is empty on initialization."""
-        account = Account(
-            account="123456789012",
-            region="us-west-2",
-        )
-        assert account.buckets == {}
-        assert len(account.buckets) == 0
+        assert hasattr(loaded_account, "describe")
+        assert hasattr(loaded_account, "to_dict")
+        assert hasattr(loaded_account, "resolve_date")
 
     @mock_aws
-    def test_list_buckets_filters_none_names(self):
+    def test_list_buckets_filters_none_names(self, s3_clients, bucket_configurations):
         """Test that list_buckets handles buckets without names."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="valid-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="valid-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account = Account(
             account="123456789012",
@@ -210,10 +186,10 @@ class TestAccount:
         assert all(bucket.name for bucket in buckets)
 
     @mock_aws
-    def test_bucket_inherits_account_and_region(self):
+    def test_bucket_inherits_account_and_region(self, s3_clients, bucket_configurations):
         """Test that buckets created by Account inherit account and region."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         account = Account(
             account="123456789012",
@@ -227,11 +203,10 @@ class TestAccount:
         assert bucket.region == "us-west-2"
         assert bucket.parent == account
 
-    @mock_aws
     def test_multiple_accounts_different_regions(self):
         """Test creating multiple Account objects with different regions."""
-        client1 = boto3.client("s3", region_name="us-west-2")
-        client2 = boto3.client("s3", region_name="us-east-1")
+        client1 = MagicMock()
+        client2 = MagicMock()
 
         account1 = Account(account="111111111111", region="us-west-2", client=client1)
         account2 = Account(account="222222222222", region="us-east-1", client=client2)
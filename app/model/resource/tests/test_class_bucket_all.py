@@ -2,57 +2,87 @@
 
 from __future__ import annotations
 
-import boto3
+from unittest.mock import MagicMock, Mock
+
+import pytest
 from botocore.exceptions import ClientError
 from moto import mock_aws
+from moto.core import DEFAULT_ACCOUNT_ID
+from moto.s3.models import s3_backends
 
 from app.model.lifecycle.lifecycleconfiguration import LifecycleConfiguration
 from app.model.lifecycle.lifecyclerule import LifecycleRule
 from app.model.resource.bucket import Bucket
 
 
+def _stored_rules(bucketname: str) -> list:
+    # Read moto's backend directly rather than round-tripping through the client
+    return s3_backends[DEFAULT_ACCOUNT_ID]["global"].buckets[bucketname].rules
+
+
+CASES = [
+    pytest.param("test-bucket", "123456789012", "us-west-2", id="all-parameters"),
+    pytest.param("minimal-bucket", "123456789012", "us-east-1", id="us-east-1"),
+    pytest.param("my-test-bucket-123", "123456789012", "us-east-1", id="name-with-digits"),
+    pytest.param("bucket-2", "222222222222", "us-west-2", id="other-account"),
+]
+
+_RULE_PAYLOAD = {"ID": "new-rule", "Status": "Enabled", "Prefix": "logs/", "Expiration": {"Days": 30}}
+RULE_CASES = [
+    pytest.param(
+        LifecycleRule(id="new-rule", status="Enabled", prefix="logs/", expiration={"days": 30}),
+        id="rule-object",
+    ),
+    pytest.param(_RULE_PAYLOAD, id="dict"),
+]
+
+
 class TestBucket:
     """Test Bucket configuration class."""
 
     @mock_aws
-    def test_init_with_all_parameters(self):
-        """Test initialization with all parameters."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+    @pytest.mark.parametrize("name,account,region", CASES)
+    def test_init(self, s3_clients, bucket_configurations, name, account, region):
+        """Test initialization across names, accounts and regions."""
+        client = s3_clients[region]
+        if region == "us-east-1":
+            client.create_bucket(Bucket=name)
+        else:
+            client.create_bucket(Bucket=name, CreateBucketConfiguration=bucket_configurations[region])
 
         bucket = Bucket(
-            name="test-bucket",
-            account="123456789012",
-            region="us-west-2",
+            name=name,
+            account=account,
+            region=region,
             client=client,
         )
-        assert bucket.name == "test-bucket"
-        assert bucket.account == "123456789012"
-        assert bucket.region == "us-west-2"
-        assert bucket.client == client
-        assert bucket.lifecycle_configuration is not None
+        assert (bucket.name, bucket.account, bucket.region) == (name, account, region)
+        assert bucket.client is client
+        assert isinstance(bucket.lifecycle_configuration, LifecycleConfiguration)
 
     @mock_aws
-    def test_init_with_minimal_parameters(self):
-        """Test initialization with minimal parameters."""
-        client = boto3.client("s3", region_name="us-east-1")
-        client.create_bucket(Bucket="minimal-bucket")
+    def test_init_defers_lifecycle_request(self, s3_clients, bucket_configurations):
+        """Test construction issues no lifecycle request until lifecycle_configuration is read."""
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
+        spy = Mock(wraps=client)
 
         bucket = Bucket(
-            name="minimal-bucket",
+            name="test-bucket",
             account="123456789012",
-            region="us-east-1",
-            client=client,
+            region="us-west-2",
+            client=spy,
         )
-        assert bucket.name == "minimal-bucket"
-        assert bucket.account == "123456789012"
-        assert bucket.region == "us-east-1"
+        spy.get_bucket_lifecycle_configuration.assert_not_called()
+        assert isinstance(bucket.lifecycle_configuration, LifecycleConfiguration)
+        assert isinstance(bucket.lifecycle_configuration, LifecycleConfiguration)
+        spy.get_bucket_lifecycle_configuration.assert_called_once()
 
     @mock_aws
-    def test_load_method_loads_lifecycle_configuration(self):
+    def test_load_method_loads_lifecycle_configuration(self, s3_clients, bucket_configurations):
         """Test that load method loads lifecycle configuration."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         bucket = Bucket(
             name="test-bucket",
@@ -65,10 +95,10 @@ class TestBucket:
         assert isinstance(bucket.lifecycle_configuration, LifecycleConfiguration)
 
     @mock_aws
-    def test_get_lifecycle_configuration_with_no_configuration(self):
+    def test_get_lifecycle_configuration_with_no_configuration(self, s3_clients, bucket_configurations):
         """Test get_lifecycle_configuration when bucket has no configuration."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         bucket = Bucket(
             name="test-bucket",
@@ -80,10 +110,10 @@ class TestBucket:
         assert isinstance(config, LifecycleConfiguration)
 
     @mock_aws
-    def test_get_lifecycle_configuration_with_existing_configuration(self):
+    def test_get_lifecycle_configuration_with_existing_configuration(self, s3_clients, bucket_configurations):
         """Test get_lifecycle_configuration when bucket has configuration."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         # Put a lifecycle configuration
         client.put_bucket_lifecycle_configuration(
@@ -104,9 +134,9 @@ class TestBucket:
         assert len(config.rules) > 0
 
     @mock_aws
-    def test_get_lifecycle_configuration_handles_no_such_configuration(self):
+    def test_get_lifecycle_configuration_handles_no_such_configuration(self, s3_clients):
         """Test that get_lifecycle_configuration handles NoSuchLifecycleConfiguration."""
-        client = boto3.client("s3", region_name="us-east-1")
+        client = s3_clients["us-east-1"]
         client.create_bucket(Bucket="no-config-bucket")
 
         bucket = Bucket(
@@ -120,10 +150,10 @@ class TestBucket:
         assert isinstance(config, LifecycleConfiguration)
 
     @mock_aws
-    def test_put_lifecycle_configuration(self):
+    def test_put_lifecycle_configuration(self, s3_clients, bucket_configurations):
         """Test put_lifecycle_configuration method."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         bucket = Bucket(
             name="test-bucket",
@@ -140,15 +170,13 @@ class TestBucket:
         bucket.put_lifecycle_configuration(config)
 
         # Verify it was set
-        response = client.get_bucket_lifecycle_configuration(Bucket="test-bucket")
-        assert "Rules" in response
-        assert len(response["Rules"]) > 0
+        assert [stored.id for stored in _stored_rules("test-bucket")] == ["test-rule"]
 
     @mock_aws
-    def test_put_lifecycle_configuration_with_empty_config_deletes(self):
+    def test_put_lifecycle_configuration_with_empty_config_deletes(self, s3_clients, bucket_configurations):
         """Test put_lifecycle_configuration with empty config deletes lifecycle."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         # First, put a configuration
         client.put_bucket_lifecycle_configuration(
@@ -170,37 +198,31 @@ class TestBucket:
         bucket.put_lifecycle_configuration(empty_config)
 
         # Verify it was deleted
-        try:
-            client.get_bucket_lifecycle_configuration(Bucket="test-bucket")
-            assert False, "Expected NoSuchLifecycleConfiguration error"
-        except ClientError as e:
-            assert e.response["Error"]["Code"] == "NoSuchLifecycleConfiguration"
+        assert _stored_rules("test-bucket") == []
 
     @mock_aws
-    def test_add_rule_with_lifecycle_rule_object(self):
-        """Test add_rule with LifecycleRule object."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+    def test_put_lifecycle_configuration_failure_chains_cause(self, s3_clients):
+        """Test put_lifecycle_configuration wraps client errors and keeps the cause."""
+        client = s3_clients["us-west-2"]
 
         bucket = Bucket(
-            name="test-bucket",
+            name="missing-bucket",
             account="123456789012",
             region="us-west-2",
             client=client,
         )
 
-        rule = LifecycleRule(id="new-rule", status="Enabled", expiration={"days": 60}, prefix="logs/")
-        bucket.add_rule(rule)
-
-        # Verify the rule was added
-        config = bucket.get_lifecycle_configuration()
-        assert any(rule.id == "new-rule" for rule in config.rules.values())
+        config = LifecycleConfiguration(rules=[LifecycleRule(id="rule", status="Enabled", expiration={"days": 30})])
+        with pytest.raises(RuntimeError, match="Failed to put lifecycle configuration") as excinfo:
+            bucket.put_lifecycle_configuration(config)
+        assert isinstance(excinfo.value.__cause__, ClientError)
 
     @mock_aws
-    def test_add_rule_with_dict(self):
-        """Test add_rule with dict."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+    @pytest.mark.parametrize("rule", RULE_CASES)
+    def test_add_rule(self, s3_clients, bucket_configurations, rule):
+        """Test add_rule with a LifecycleRule object or dict."""
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         bucket = Bucket(
             name="test-bucket",
@@ -208,25 +230,15 @@ class TestBucket:
             region="us-west-2",
             client=client,
         )
-
-        rule_dict = {
-            "ID": "dict-rule",
-            "Status": "Enabled",
-            "Expiration": {"Days": 90},
-            "Prefix": "data/",
-        }
-        bucket.add_rule(rule_dict)
+        bucket.add_rule(rule)
 
         # Verify the rule was added
         config = bucket.get_lifecycle_configuration()
-        assert any(rule.id == "dict-rule" for rule in config.rules.values())
+        assert [rule.id for rule in config.rules.values()] == ["new-rule"]
 
-    @mock_aws
     def test_add_rule_with_invalid_type_raises_error(self):
         """Test add_rule with invalid type raises ValueError."""
-        client = boto3.client("s3", region_name="us-east-1")
-        client.create_bucket(Bucket="test-bucket")
-
+        client = MagicMock()
         bucket = Bucket(
             name="test-bucket",
             account="123456789012",
@@ -234,24 +246,22 @@ class TestBucket:
             client=client,
         )
 
-        try:
+        with pytest.raises(ValueError, match="must be an instance of LifecycleRule or dict"):
             bucket.add_rule("invalid-rule")
-            assert False, "Expected ValueError"
-        except ValueError as e:
-            assert "must be an instance of LifecycleRule or dict" in str(e)
+        # Validation runs before the lifecycle configuration is fetched or written
+        assert client.method_calls == []
 
     @mock_aws
-    def test_remove_rule_with_lifecycle_rule_object(self):
-        """Test remove_rule with LifecycleRule object."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+    @pytest.mark.parametrize("rule", RULE_CASES)
+    def test_remove_rule(self, s3_clients, bucket_configurations, rule):
+        """Test remove_rule with a LifecycleRule object or dict matching a rule stored in S3."""
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
-        # Put initial configuration
+        # Put initial configuration directly, so removal matches a rule parsed from the response
         client.put_bucket_lifecycle_configuration(
             Bucket="test-bucket",
-            LifecycleConfiguration={
-                "Rules": [{"ID": "rule-to-remove", "Status": "Enabled", "Prefix": "logs/", "Expiration": {"Days": 30}}]
-            },
+            LifecycleConfiguration={"Rules": [dict(_RULE_PAYLOAD)]},
         )
 
         bucket = Bucket(
@@ -260,55 +270,15 @@ class TestBucket:
             region="us-west-2",
             client=client,
         )
-
-        rule = LifecycleRule(id="rule-to-remove", status="Enabled", prefix="logs/", expiration={"days": 30})
         bucket.remove_rule(rule)
 
         # Verify the rule was removed
         config = bucket.get_lifecycle_configuration()
-        assert not any(rule.id == "rule-to-remove" for rule in config.rules.values())
+        assert [rule.id for rule in config.rules.values()] == []
 
-    @mock_aws
-    def test_remove_rule_with_dict(self):
-        """Test remove_rule with dict."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
-
-        # Put initial configuration
-        client.put_bucket_lifecycle_configuration(
-            Bucket="test-bucket",
-            LifecycleConfiguration={
-                "Rules": [
-                    {"ID": "dict-rule-remove", "Status": "Enabled", "Prefix": "logs/", "Expiration": {"Days": 30}}
-                ]
-            },
-        )
-
-        bucket = Bucket(
-            name="test-bucket",
-            account="123456789012",
-            region="us-west-2",
-            client=client,
-        )
-
-        rule_dict = {
-            "ID": "dict-rule-remove",
-            "Status": "Enabled",
-            "Prefix": "logs/",
-            "Expiration": {"Days": 30},
-        }
-        bucket.remove_rule(rule_dict)
-
-        # Verify the rule was removed
-        config = bucket.get_lifecycle_configuration()
-        assert not any(rule.id == "dict-rule-remove" for rule in config.rules.values())
-
-    @mock_aws
     def test_remove_rule_with_invalid_type_raises_error(self):
         """Test remove_rule with invalid type raises ValueError."""
-        client = boto3.client("s3", region_name="us-east-1")
-        client.create_bucket(Bucket="test-bucket")
-
+        client = MagicMock()
         bucket = Bucket(
             name="test-bucket",
             account="123456789012",
@@ -316,18 +286,17 @@ class TestBucket:
             client=client,
         )
 
-        try:
+        with pytest.raises(ValueError, match="must be an instance of LifecycleRule or dict"):
             bucket.remove_rule(12345)
-            assert False, "Expected ValueError"
-        except ValueError as e:
-            assert "must be an instance of LifecycleRule or dict" in str(e)
+        # Validation runs before the lifecycle configuration is fetched or written
+        assert client.method_calls == []
 
     @mock_aws
-    def test_describe_returns_dict_with_name(self):
+    def test_describe_returns_dict_with_name(self, s3_clients, bucket_configurations):
         """Test that describe returns dict with bucket name."""
-        client = boto3.client("s3", region_name="ap-southeast-2")
+        client = s3_clients["ap-southeast-2"]
         client.create_bucket(
-            Bucket="describe-bucket", CreateBucketConfiguration={"LocationConstraint": "ap-southeast-2"}
+            Bucket="describe-bucket", CreateBucketConfiguration=bucket_configurations["ap-southeast-2"]
         )
 
         bucket = Bucket(
@@ -343,10 +312,10 @@ class TestBucket:
         assert result["region"] == "ap-southeast-2"
 
     @mock_aws
-    def test_to_dict_returns_serializable_dict(self):
+    def test_to_dict_returns_serializable_dict(self, s3_clients, bucket_configurations):
         """Test that to_dict returns a serializable dictionary."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         bucket = Bucket(
             name="test-bucket",
@@ -363,10 +332,10 @@ class TestBucket:
         assert result["name"] == "test-bucket"
 
     @mock_aws
-    def test_bucket_inheritance_from_s3component(self):
+    def test_bucket_inheritance_from_s3component(self, s3_clients, bucket_configurations):
         """Test that Bucket inherits from S3Component."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="test-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         bucket = Bucket(
             name="test-bucket",
@@ -379,11 +348,11 @@ class TestBucket:
         assert hasattr(bucket, "resolve_date")
 
     @mock_aws
-    def test_bucket_with_parent(self):
+    def test_bucket_with_parent(self, s3_clients):
         """Test bucket with parent S3Component."""
         from app.model.resource.account import Account
 
-        client = boto3.client("s3", region_name="us-east-1")
+        client = s3_clients["us-east-1"]
         account = Account(
             account="parent-account",
             region="us-east-1",
@@ -405,10 +374,10 @@ class TestBucket:
         assert bucket.parent == account
 
     @mock_aws
-    def test_add_and_remove_rule_workflow(self):
+    def test_add_and_remove_rule_workflow(self, s3_clients, bucket_configurations):
         """Test complete workflow of adding and removing rules."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="workflow-bucket", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="workflow-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
 
         bucket = Bucket(
             name="workflow-bucket",
@@ -427,41 +396,81 @@ class TestBucket:
 
         # Verify both rules exist
         config = bucket.get_lifecycle_configuration()
-        assert any(rule.id == "rule-1" for rule in config.rules.values())
-        assert any(rule.id == "rule-2" for rule in config.rules.values())
+        assert sorted(rule.id for rule in config.rules.values()) == ["rule-1", "rule-2"]
 
         # Remove first rule
         bucket.remove_rule(rule1)
 
         # Verify only second rule remains
         config = bucket.get_lifecycle_configuration()
-        assert not any(rule.id == "rule-1" for rule in config.rules.values())
-        assert any(rule.id == "rule-2" for rule in config.rules.values())
+        assert [rule.id for rule in config.rules.values()] == ["rule-2"]
+
+    @mock_aws
+    def test_add_rules_puts_configuration_once(self, s3_clients, bucket_configurations):
+        """Test add_rules applies every rule with a single put request."""
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="batch-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
+        spy = Mock(wraps=client)
+
+        bucket = Bucket(
+            name="batch-bucket",
+            account="123456789012",
+            region="us-west-2",
+            client=spy,
+        )
+
+        bucket.add_rules(
+            [
+                LifecycleRule(id="rule-1", status="Enabled", expiration={"days": 30}, prefix="logs/"),
+                {"ID": "rule-2", "Status": "Enabled", "Expiration": {"Days": 60}, "Prefix": "data/"},
+            ]
+        )
+
+        assert spy.put_bucket_lifecycle_configuration.call_count == 1
+        config = bucket.get_lifecycle_configuration()
+        assert sorted(rule.id for rule in config.rules.values()) == ["rule-1", "rule-2"]
+
+    @mock_aws
+    def test_remove_rules_puts_configuration_once(self, s3_clients, bucket_configurations):
+        """Test remove_rules drops every rule with a single put request."""
+        client = s3_clients["us-west-2"]
+        client.create_bucket(Bucket="batch-bucket", CreateBucketConfiguration=bucket_configurations["us-west-2"])
+
+        rule1 = LifecycleRule(id="rule-1", status="Enabled", expiration={"days": 30}, prefix="logs/")
+        rule2 = LifecycleRule(id="rule-2", status="Enabled", expiration={"days": 60}, prefix="data/")
+        rule3 = LifecycleRule(id="rule-3", status="Enabled", expiration={"days": 90}, prefix="tmp/")
+        Bucket(name="batch-bucket", account="123456789012", region="us-west-2", client=client).add_rules(
+            [rule1, rule2, rule3]
+        )
+
+        spy = Mock(wraps=client)
+        bucket = Bucket(
+            name="batch-bucket",
+            account="123456789012",
+            region="us-west-2",
+            client=spy,
+        )
+        bucket.remove_rules([rule1, rule3])
+
+        assert spy.put_bucket_lifecycle_configuration.call_count == 1
+        config = bucket.get_lifecycle_configuration()
+        assert [rule.id for rule in config.rules.values()] == ["rule-2"]
 
     @mock_aws
-    def test_bucket_name_with_special_characters(self):
-        """Test bucket with various naming formats."""
-        client = boto3.client("s3", region_name="us-east-1")
-        client.create_bucket(Bucket="my-test-bucket-123")
+    def test_add_rules_with_invalid_type_leaves_configuration_untouched(self, s3_clients):
+        """Test add_rules validates every rule before applying any."""
+        client = s3_clients["us-east-1"]
+        client.create_bucket(Bucket="test-bucket")
 
         bucket = Bucket(
-            name="my-test-bucket-123",
+            name="test-bucket",
             account="123456789012",
             region="us-east-1",
             client=client,
         )
-        assert bucket.name == "my-test-bucket-123"
 
-    @mock_aws
-    def test_multiple_buckets_different_configurations(self):
-        """Test creating multiple Bucket objects with different configurations."""
-        client = boto3.client("s3", region_name="us-west-2")
-        client.create_bucket(Bucket="bucket-1", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
-        client.create_bucket(Bucket="bucket-2", CreateBucketConfiguration={"LocationConstraint": "us-west-2"})
-
-        bucket1 = Bucket(name="bucket-1", account="111111111111", region="us-west-2", client=client)
-        bucket2 = Bucket(name="bucket-2", account="222222222222", region="us-west-2", client=client)
-
-        assert bucket1.name == "bucket-1"
-        assert bucket2.name == "bucket-2"
-        assert bucket1.account != bucket2.account
+        rule = LifecycleRule(id="valid-rule", status="Enabled", expiration={"days": 30})
+        with pytest.raises(ValueError, match="must be an instance of LifecycleRule or dict"):
+            bucket.add_rules([rule, "invalid-rule"])
+
+        assert not bucket.get_lifecycle_configuration().rules
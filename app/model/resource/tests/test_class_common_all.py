@@ -3,20 +3,20 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from unittest.mock import MagicMock
 
-import boto3
+import pytest
 from moto import mock_aws
 
-from app.model.resource.common import S3Component
+from app.model.resource.common import S3Component, _get_default_client
 
 
 class TestS3Component:
     """Test S3Component base class."""
 
-    @mock_aws
     def test_init_with_all_parameters(self):
         """Test initialization with all parameters."""
-        client = boto3.client("s3", region_name="us-west-2")
+        client = MagicMock()
         component = S3Component(
             account="123456789012",
             region="us-west-2",
@@ -37,12 +37,12 @@ class TestS3Component:
         assert component.region == "us-east-1"
         assert component.client is not None
 
-    @mock_aws
     def test_resolve_account_from_parent(self):
         """Test that account is resolved from parent."""
         parent = S3Component(
             account="parent-account",
             region="us-west-2",
+            client=MagicMock(),
         )
         child = S3Component(
             account=None,
@@ -51,12 +51,12 @@ class TestS3Component:
         )
         assert child.account == "parent-account"
 
-    @mock_aws
     def test_resolve_region_from_parent(self):
         """Test that region is resolved from parent."""
         parent = S3Component(
             account="123456789012",
             region="parent-region",
+            client=MagicMock(),
         )
         child = S3Component(
             account="123456789012",
@@ -65,10 +65,9 @@ class TestS3Component:
         )
         assert child.region == "parent-region"
 
-    @mock_aws
     def test_resolve_client_from_parent(self):
         """Test that client is resolved from parent."""
-        client = boto3.client("s3", region_name="us-west-2")
+        client = MagicMock()
         parent = S3Component(
             account="123456789012",
             region="us-west-2",
@@ -91,56 +90,92 @@ class TestS3Component:
         assert component.client is not None
 
     @mock_aws
+    def test_resolve_client_reuses_default_per_region(self):
+        """Test that default clients are shared within a region only."""
+        first = S3Component(account="123456789012", region="us-west-2")
+        second = S3Component(account="123456789012", region="us-west-2")
+        other = S3Component(account="123456789012", region="eu-west-1")
+        assert first.client is second.client
+        assert other.client is not first.client
+        assert other.client.meta.region_name == "eu-west-1"
+
+    def test_default_clients_do_not_outlive_their_test(self):
+        """Test each test starts without default clients cached by earlier mocks."""
+        assert _get_default_client.cache_info().currsize == 0
+        with mock_aws():
+            S3Component(account="123456789012", region="us-west-2")
+        assert _get_default_client.cache_info().currsize == 1
+
     def test_resolve_date_with_date_object(self):
         """Test resolve_date with date object."""
         component = S3Component(
             account="123456789012",
             region="us-west-2",
+            client=MagicMock(),
         )
         test_date = date(2025, 1, 15)
         result = component.resolve_date(test_date)
         assert result == test_date
         assert isinstance(result, date)
 
-    @mock_aws
     def test_resolve_date_with_datetime_object(self):
         """Test resolve_date with datetime object."""
         component = S3Component(
             account="123456789012",
             region="us-west-2",
+            client=MagicMock(),
         )
         test_datetime = datetime(2025, 1, 15, 10, 30, 0)
         result = component.resolve_date(test_datetime)
         assert result == test_datetime.date()
         assert isinstance(result, date)
 
-    @mock_aws
     def test_resolve_date_with_string(self):
         """Test resolve_date with string."""
         component = S3Component(
             account="123456789012",
             region="us-west-2",
+            client=MagicMock(),
         )
         result = component.resolve_date("2025-01-15")
         assert result == date(2025, 1, 15)
         assert isinstance(result, date)
 
-    @mock_aws
+    def test_resolve_date_with_unpadded_string(self):
+        """Test resolve_date falls back to strptime for non zero-padded strings."""
+        component = S3Component(
+            account="123456789012",
+            region="us-west-2",
+            client=MagicMock(),
+        )
+        assert component.resolve_date("2025-1-5") == date(2025, 1, 5)
+
+    def test_resolve_date_with_invalid_string(self):
+        """Test resolve_date raises ValueError for out-of-range dates."""
+        component = S3Component(
+            account="123456789012",
+            region="us-west-2",
+            client=MagicMock(),
+        )
+        with pytest.raises(ValueError):
+            component.resolve_date("2025-13-01")
+
     def test_resolve_date_with_none(self):
         """Test resolve_date with None."""
         component = S3Component(
             account="123456789012",
             region="us-west-2",
+            client=MagicMock(),
         )
         result = component.resolve_date(None)
         assert result is None
 
-    @mock_aws
     def test_describe_returns_dict(self):
         """Test that describe returns a dictionary."""
         component = S3Component(
             account="123456789012",
             region="us-west-2",
+            client=MagicMock(),
         )
         result = component.describe()
         assert isinstance(result, dict)
@@ -149,24 +184,24 @@ class TestS3Component:
         assert result["account"] == "123456789012"
         assert result["region"] == "us-west-2"
 
-    @mock_aws
     def test_to_dict_returns_dict(self):
         """Test that to_dict returns a dictionary."""
         component = S3Component(
             account="123456789012",
             region="us-west-2",
+            client=MagicMock(),
         )
         result = component.to_dict()
         assert isinstance(result, dict)
         assert "account" in result
         assert "region" in result
 
-    @mock_aws
     def test_parent_child_hierarchy(self):
         """Test parent-child hierarchy."""
         parent = S3Component(
             account="123456789012",
             region="us-west-2",
+            client=MagicMock(),
         )
         child = S3Component(
             account=None,
@@ -177,37 +212,29 @@ class TestS3Component:
         assert child.account == parent.account
         assert child.region == parent.region
 
-    @mock_aws
     def test_component_inherits_from_component(self):
         """Test that S3Component inherits from Component."""
         component = S3Component(
             account="123456789012",
             region="us-west-2",
+            client=MagicMock(),
         )
         # Check for Component methods
         assert hasattr(component, "describe")
         assert hasattr(component, "to_dict")
 
-    @mock_aws
     def test_invalid_account_raises_error(self):
         """Test that invalid account raises ValueError."""
-        try:
+        with pytest.raises(ValueError, match="(?i)invalid"):
             S3Component(
                 account=None,
                 region="us-west-2",
             )
-            assert False, "Expected ValueError"
-        except ValueError as e:
-            assert "invalid" in str(e).lower()
 
-    @mock_aws
     def test_invalid_region_raises_error(self):
         """Test that invalid region raises ValueError."""
-        try:
+        with pytest.raises(ValueError, match="(?i)invalid"):
             S3Component(
                 account="123456789012",
                 region=None,
             )
-            assert False, "Expected ValueError"
-        except ValueError as e:
-            assert "invalid" in str(e).lower()
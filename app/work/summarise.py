@@ -38,7 +38,8 @@ class SummariseWork(Component):
             region=region,
             parent=self,
         )
-        account.load()
+        # Every bucket's lifecycle configuration is read below, so fetch them concurrently
+        account.load(prefetch=True)
 
         self.info(
             f"Loaded {len(account.buckets)} bucket resources",
@@ -73,7 +74,6 @@ class SummariseWork(Component):
         #     ]
         # }
         for bucketname, bucket in account.buckets.items():
-            bucket.load()
             lcc: LifecycleConfiguration = bucket.lifecycle_configuration
             rules = lcc.rules.values()
             if not rules:
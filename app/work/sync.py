@@ -41,7 +41,8 @@ class SyncWork(Component):
             region=region,
             parent=self,
         )
-        account.load()
+        # Bucket lifecycle configurations are read below, so fetch them concurrently
+        account.load(prefetch=True)
 
         # Find overlapping buckets
         bucketnames: list[str] = list(set(account_def.buckets.keys()) & set(account.buckets.keys()))
@@ -64,22 +65,24 @@ class SyncWork(Component):
                 },
             )
 
-            # Apply additions
-            for rule in diff_added_lcc:
+            # Apply additions with a single put
+            if diff_added_lcc:
+                added_ids = [rule.id for rule in diff_added_lcc]
                 try:
-                    bucket_res.add_rule(rule)
-                    self.info(f"Added rule '{rule.id}' to bucket '{bucketname}'")
+                    bucket_res.add_rules(diff_added_lcc)
+                    self.info(f"Added {len(added_ids)} rule(s) to bucket '{bucketname}'", context={"rules": added_ids})
                 except Exception as e:
-                    msg = f"Failed to add rule '{rule.id}' to bucket '{bucketname}': {e}"
-                    self.warning(msg)
-                    continue
+                    msg = f"Failed to add rules to bucket '{bucketname}': {e}"
+                    self.warning(msg, context={"rules": added_ids})
 
-            # Apply removals
-            for rule in diff_removed_lcc:
+            # Apply removals with a single put
+            if diff_removed_lcc:
+                removed_ids = [rule.id for rule in diff_removed_lcc]
                 try:
-                    bucket_res.remove_rule(rule)
-                    self.info(f"Removed rule '{rule.id}' from bucket '{bucketname}'")
+                    bucket_res.remove_rules(diff_removed_lcc)
+                    self.info(
+                        f"Removed {len(removed_ids)} rule(s) from bucket '{bucketname}'", context={"rules": removed_ids}
+                    )
                 except Exception as e:
-                    msg = f"Failed to remove rule '{rule.id}' from bucket '{bucketname}': {e}"
-                    self.warning(msg)
-                    continue
+                    msg = f"Failed to remove rules from bucket '{bucketname}': {e}"
+                    self.warning(msg, context={"rules": removed_ids})